@@ -1,20 +1,9 @@
 import streamlit as st
 import pandas as pd
 import os
+import json
 import logging
 from dotenv import load_dotenv
-from scraper import (
-    linkedin_login, 
-    search_profiles,
-    extract_company_domain, 
-    get_valid_email,
-    get_contact_details,
-    clean_name,
-    clean_text_data,
-    get_profile_data_hybrid,
-    get_company_domain_hybrid,
-    PROXYCURL_AVAILABLE
-)
 import time
 
 # Configure logging
@@ -38,6 +27,13 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource(show_spinner="Loading the scraping engine...")
+def load_scraper():
+    """Import the scraper (selenium, DNS and API clients) once per server, on first use"""
+    import scraper
+    scraper.log_environment_status()
+    return scraper
+
 def main():
     st.title("🔍 LinkedIn Lead Generator Pro")
     
@@ -46,6 +42,8 @@ def main():
         st.header("Search Parameters")
         keyword = st.text_input("Search Keyword", "AI Product Manager")
         limit = st.slider("Number of profiles", 5, 100, 10)
+        resume = st.checkbox("Resume the last run for this keyword", value=False,
+                             help="Reload finished profiles from the run journal and skip them")
         
         st.header("Email Settings")
         email_template = st.text_area(
@@ -70,7 +68,8 @@ def main():
                            verify_emails=verify_emails,
                            add_generic_emails=add_generic_emails,
                            guess_domains=guess_domains,
-                           use_github=use_github)
+                           use_github=use_github,
+                           resume=resume)
     
     with tab2:
         if 'leads_df' in st.session_state and not st.session_state.leads_df.empty:
@@ -81,12 +80,37 @@ def main():
     with tab3:
         st.subheader("Debug Information")
         if 'debug_info' in st.session_state:
+            stage_timings = st.session_state.debug_info.get("stage_timings")
+            if stage_timings:
+                st.markdown("**Stage timings (seconds)**")
+                st.dataframe(pd.DataFrame.from_dict(stage_timings, orient="index").sort_values("total_s", ascending=False))
+                st.download_button(
+                    label="📥 Download Timings JSON",
+                    data=st.session_state.get("stage_timings_json", json.dumps(stage_timings, indent=2)),
+                    file_name="stage_timings.json",
+                    mime="application/json"
+                )
             st.json(st.session_state.debug_info)
         else:
             st.info("No debug information available yet. Run extraction first.")
 
-def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True, guess_domains=True, use_github=True):
+def store_debug_info(debug_info, keyword, limit):
+    """Attach cache, wait and stage timing stats to the debug info and keep it in session state"""
+    scraper = load_scraper()
+    debug_info["dns_cache"] = scraper.get_dns_cache_stats()
+    debug_info["company_cache"] = scraper.get_company_cache_stats()
+    debug_info["company_index"] = scraper.get_company_index_stats()
+    debug_info["api_cache"] = scraper.get_api_cache_stats()
+    debug_info["http"] = scraper.get_http_stats()
+    debug_info["page_waits"] = scraper.get_wait_stats()
+    debug_info["stage_timings"] = scraper.get_stage_metrics()
+    st.session_state.stage_timings_json = scraper.export_stage_metrics(keyword=keyword, limit=limit)
+    st.session_state.debug_info = debug_info
+
+def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True, guess_domains=True, use_github=True,
+                   resume=False):
     """Run the lead generation process"""
+    scraper = load_scraper()
     debug_info = {
         "profiles_found": 0,
         "domains_found": 0,
@@ -96,116 +120,237 @@ def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True,
             "pattern_generation": 0,
             "github": 0,
             "fallback": 0,
-            "proxycurl": 0
+            "proxycurl": 0,
+            "learned_format": 0
         },
         "errors": [],
         "profile_details": []
     }
     
     # Add Proxycurl status to debug info
-    debug_info["proxycurl_available"] = PROXYCURL_AVAILABLE
+    debug_info["proxycurl_available"] = scraper.PROXYCURL_AVAILABLE
+    
+    # Count cache hits/misses and page waits for this run only
+    scraper.reset_dns_cache_stats()
+    scraper.reset_company_cache_stats()
+    scraper.reset_company_index_stats()
+    scraper.reset_api_cache_stats()
+    scraper.reset_http_stats()
+    scraper.reset_wait_stats()
+    scraper.reset_stage_metrics()
+    
+    # Keep this run's debug screenshots together under the data directory
+    debug_info["screenshot_dir"] = scraper.start_screenshot_run()
+    
+    # Finished profiles waiting to be written to the lead store in one transaction
+    pending_leads = []
+    debug_info["lead_store_hits"] = 0
     
     try:
         with st.spinner("🔒 Logging in to LinkedIn..."):
-            driver = linkedin_login()
-        
-        with st.spinner(f"🔍 Searching for '{keyword}' profiles..."):
-            profiles = search_profiles(driver, keyword, limit=limit)
-            debug_info["profiles_found"] = len(profiles)
-            st.success(f"✅ Found {len(profiles)} profiles")
+            driver = scraper.linkedin_login()
         
         # Add option to use Proxycurl
-        use_proxycurl = PROXYCURL_AVAILABLE
-        if PROXYCURL_AVAILABLE:
+        use_proxycurl = scraper.PROXYCURL_AVAILABLE
+        if scraper.PROXYCURL_AVAILABLE:
             use_proxycurl = st.checkbox("Use Proxycurl API (faster and more reliable)", value=True)
             if use_proxycurl:
                 st.info("Using Proxycurl API for enhanced data extraction")
         
         leads = []
         all_profiles = []
+        interim_table = {"table": None}
+        profiles = []
+        prefetched = {}
         progress_bar = st.progress(0)
+        cache_placeholder = st.empty()
+        pipeline_placeholder = st.empty()
         results_placeholder = st.empty()
         status_placeholder = st.empty()
         
-        status_placeholder.info("Processing profiles... This may take a few minutes.")
+        status_placeholder.info(f"🔍 Searching for '{keyword}' profiles...")
         
-        for i, profile in enumerate(profiles):
-            profile_debug = {
-                "name": profile["name"],
-                "url": profile["url"],
-                "domain_found": False,
-                "email_found": False,
-                "email_source": None,
-                "errors": []
-            }
+        def enrich_batch(batch):
+            """Enrich each page of search results through Proxycurl in one concurrent batch"""
+            with st.spinner(f"⚡ Enriching {len(batch)} profiles via Proxycurl..."):
+                prefetched.update(scraper.enrich_profiles_proxycurl(batch))
+            api_cache = scraper.get_api_cache_stats()
+            cache_placeholder.caption(f"Proxycurl cache: {api_cache['hits'] + api_cache['negative_hits']} hits, "
+                                      f"{api_cache['misses']} misses")
+        
+        stored_leads = {}
+        
+        def prepare_batch(batch):
+            """Look up a page of search results in the lead store, then enrich only the stale ones"""
+            stored_leads.update(scraper.get_fresh_leads([profile.url for profile in batch]))
+            known = stored_leads.keys() | done_urls
+            stale = [profile for profile in batch if scraper.normalize_linkedin_url(profile.url) not in known]
+            if use_proxycurl and stale:
+                enrich_batch(stale)
+        
+        def verify_domain(item):
+            """Warm the DNS verdict cache for the company domain before email resolution"""
+            domain = item["profile_data"]["company_domain"]
+            if domain:
+                item["profile_debug"]["domain_accepts_mail"] = scraper.domain_accepts_mail(domain)
+            return item
+        
+        def resolve_email(item):
+            scraper.resolve_profile_email(item["profile_data"])
+            return item
+        
+        def add_result(profile, profile_debug):
+            """Add a finished profile to the results, counters and interim table"""
+            if profile_debug["domain_found"]:
+                debug_info["domains_found"] += 1
+            if profile_debug["email_found"]:
+                debug_info["emails_found"] += 1
+                
+                # Count email sources for stats
+                if profile_debug["email_source"] in debug_info["email_sources"]:
+                    debug_info["email_sources"][profile_debug["email_source"]] += 1
+            
+            # Add to collection of all profiles regardless of email
+            all_profiles.append(profile)
+            
+            # Add to leads if email found
+            if profile.email:
+                leads.append(profile)
+                
+                # Show interim results: append the row instead of rebuilding the table
+                if interim_table["table"] is None:
+                    interim_table["table"] = results_placeholder.dataframe(pd.DataFrame([profile.to_row()]))
+                else:
+                    interim_table["table"].add_rows([profile.to_row()])
+            
+            debug_info["profile_details"].append(profile_debug)
+            
+            # Update progress
+            progress_bar.progress(min(len(all_profiles) / limit, 1.0))
+        
+        def record_result(item):
+            """Journal a profile that went through every stage and add it to the results (runs on the Streamlit thread)"""
+            profile, profile_data, profile_debug = item["profile"], item["profile_data"], item["profile_debug"]
             
+            # Keep what was found on the profile record itself
+            profile.update_from(profile_data)
+            profile_debug["domain_found"] = bool(profile.company_domain)
+            if profile.email:
+                profile_debug["email_found"] = True
+                profile_debug["email_source"] = profile.email_source
+            
+            # Persist before anything else so a crash can't lose it
             try:
-                with st.spinner(f"🔄 Processing {i+1}/{len(profiles)}: {profile['name']}"):
-                    status_placeholder.info(f"Processing profile {i+1}/{len(profiles)}: {profile['name']}")
-                    
-                    # Use the hybrid approach to get profile data
-                    profile_data = get_profile_data_hybrid(
-                        driver,
-                        profile["url"],
-                        use_selenium=True,
-                        use_proxycurl=use_proxycurl
-                    )
-                    
-                    # Store profile data in the expected format
-                    profile_info = {
-                        "Name": profile_data["name"] or profile["name"],
-                        "LinkedIn": profile_data["url"] or profile["url"],
-                        "First Name": profile_data["first_name"],
-                        "Last Name": profile_data["last_name"]
-                    }
-                    
-                    # Store company domain if found
-                    if profile_data["company_domain"]:
-                        profile_info["Company Domain"] = profile_data["company_domain"]
-                        profile_debug["domain_found"] = True
-                        debug_info["domains_found"] += 1
-                    
-                    # Store email if found
-                    if profile_data["email"]:
-                        profile_info["Email"] = profile_data["email"]
-                        profile_info["Email Source"] = profile_data["email_source"]
-                        profile_debug["email_found"] = True
-                        profile_debug["email_source"] = profile_data["email_source"]
-                        debug_info["emails_found"] += 1
-                        
-                        # Count email sources for stats
-                        if profile_data["email_source"] in debug_info["email_sources"]:
-                            debug_info["email_sources"][profile_data["email_source"]] += 1
-                    
-                    # Add to collection of all profiles regardless of email
-                    all_profiles.append(profile_info)
-                    
-                    # Add to leads if email found
-                    if "Email" in profile_info and profile_info["Email"]:
-                        leads.append(profile_info)
-                    
-                    # Update progress
-                    progress = (i + 1) / len(profiles)
-                    progress_bar.progress(progress)
-                    
-                    # Show interim results
-                    if leads:
-                        results_placeholder.dataframe(pd.DataFrame(leads))
+                journal.append({"profile": profile.to_dict(), "profile_debug": profile_debug})
             except Exception as e:
-                err_msg = f"Error processing {profile['name']}: {str(e)}"
-                st.error(err_msg)
-                profile_debug["errors"].append(err_msg)
-                debug_info["errors"].append(err_msg)
+                debug_info["errors"].append(f"Failed to journal {profile.url}: {str(e)}")
             
-            # Add profile debug info
-            debug_info["profile_details"].append(profile_debug)
+            # Leads reused from the store keep their original enrichment time
+            if not profile_debug.get("from_lead_store"):
+                pending_leads.append(profile.to_dict())
+                if len(pending_leads) >= scraper.LEAD_STORE_BATCH_SIZE:
+                    scraper.upsert_leads(pending_leads, keyword=keyword)
+                    pending_leads.clear()
+            
+            add_result(profile, profile_debug)
+        
+        def show_pipeline(pipeline):
+            """Per-stage throughput so the bottleneck is visible while the run goes on"""
+            pipeline_placeholder.dataframe(pd.DataFrame.from_dict(pipeline.stats(), orient="index"))
+        
+        # Every finished profile goes to the run journal; when resuming, reload the finished ones
+        journal = scraper.open_run_journal(keyword, resume=resume)
+        debug_info["journal"] = journal.path
+        done_urls = set()
+        for record in journal.load() if resume else []:
+            profile = scraper.Profile.from_dict(record["profile"])
+            add_result(profile, record["profile_debug"])
+            done_urls.add(scraper.normalize_linkedin_url(profile.url))
+        if done_urls:
+            st.info(f"♻️ Resumed {len(done_urls)} profiles from {journal.path}")
+        
+        # The browser stage runs here (the driver is not thread-safe); domain verification and
+        # email resolution run on worker threads behind bounded queues
+        pipeline = scraper.StagePipeline([
+            ("domain_verification", verify_domain, scraper.PIPELINE_DNS_WORKERS),
+            ("email_resolution", resolve_email, scraper.PIPELINE_EMAIL_WORKERS)
+        ])
+        
+        try:
+            # Process each profile as soon as search finds it
+            profile_stream = scraper.iter_search_profiles(driver, keyword, limit=limit,
+                                                          on_batch=prepare_batch)
+            for i, profile in enumerate(profile_stream):
+                profiles.append(profile)
+                debug_info["profiles_found"] = len(profiles)
+                if scraper.normalize_linkedin_url(profile.url) in done_urls:
+                    continue
+                profile_debug = {
+                    "name": profile.name,
+                    "url": profile.url,
+                    "domain_found": False,
+                    "email_found": False,
+                    "email_source": None,
+                    "errors": []
+                }
+                
+                # Enriched recently in an earlier run: reuse the stored lead without opening the browser
+                stored_lead = stored_leads.get(scraper.normalize_linkedin_url(profile.url))
+                if stored_lead:
+                    profile_debug["from_lead_store"] = True
+                    debug_info["lead_store_hits"] += 1
+                    record_result({"profile": profile, "profile_data": dict(stored_lead, url=profile.url),
+                                   "profile_debug": profile_debug})
+                    continue
+                
+                try:
+                    with st.spinner(f"🔄 Processing {i+1}/{limit}: {profile.name}"):
+                        status_placeholder.info(f"Processing profile {i+1} (up to {limit}): {profile.name}")
+                        
+                        # Use the hybrid approach to get profile data; the email is resolved downstream
+                        with pipeline.measure("browser"):
+                            profile_data = scraper.get_profile_data_hybrid(
+                                driver,
+                                profile.url,
+                                use_selenium=True,
+                                use_proxycurl=use_proxycurl and profile.url not in prefetched,
+                                search_data=profile,
+                                proxycurl_data=prefetched.get(profile.url),
+                                resolve_email=False
+                            )
+                        
+                        # Blocks while the downstream stages are behind
+                        pipeline.put({"profile": profile, "profile_data": profile_data, "profile_debug": profile_debug})
+                except Exception as e:
+                    err_msg = f"Error processing {profile.name}: {str(e)}"
+                    st.error(err_msg)
+                    profile_debug["errors"].append(err_msg)
+                    debug_info["errors"].append(err_msg)
+                    debug_info["profile_details"].append(profile_debug)
+                
+                for item in pipeline.drain():
+                    record_result(item)
+                show_pipeline(pipeline)
+        finally:
+            # Also on a failed search: finish, journal and store what already reached the workers
+            # and let the worker threads exit
+            status_placeholder.info("Finishing email resolution for the remaining profiles...")
+            for item in pipeline.close():
+                record_result(item)
+            show_pipeline(pipeline)
+            debug_info["pipeline"] = pipeline.stats()
+        scraper.upsert_leads(pending_leads, keyword=keyword)
+        pending_leads.clear()
+        
+        progress_bar.progress(1.0)
+        status_placeholder.success(f"✅ Found {len(profiles)} profiles")
         
         # Store debug info in session state
-        st.session_state.debug_info = debug_info
+        store_debug_info(debug_info, keyword, limit)
         
         # Show all profiles even if no email found
         if all_profiles:
-            all_df = pd.DataFrame(all_profiles)
+            all_df = pd.DataFrame([profile.to_row() for profile in all_profiles])
             st.session_state.all_profiles_df = all_df
             
             # Display profiles with domains but no emails
@@ -225,7 +370,7 @@ def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True,
         
         # Final results for leads with emails
         if leads:
-            df = pd.DataFrame(leads)
+            df = pd.DataFrame([profile.to_row() for profile in leads])
             st.session_state.leads_df = df
             
             # Count by source
@@ -234,7 +379,8 @@ def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True,
                 "pattern_generation": debug_info["email_sources"].get("pattern_generation", 0),
                 "github": debug_info["email_sources"].get("github", 0),
                 "fallback": debug_info["email_sources"].get("fallback", 0),
-                "proxycurl": debug_info["email_sources"].get("proxycurl", 0)
+                "proxycurl": debug_info["email_sources"].get("proxycurl", 0),
+                "learned_format": debug_info["email_sources"].get("learned_format", 0)
             }
             
             success_message = f"🎉 Successfully extracted {len(leads)} leads with emails out of {len(profiles)} profiles!"
@@ -257,10 +403,10 @@ def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True,
             # Show all profiles anyway
             if all_profiles:
                 st.warning(f"Found {len(all_profiles)} profiles but couldn't extract valid email addresses.")
-                st.dataframe(pd.DataFrame(all_profiles))
+                st.dataframe(all_df)
                 
                 # Download button for all profiles
-                csv = pd.DataFrame(all_profiles).to_csv(index=False)
+                csv = all_df.to_csv(index=False)
                 st.download_button(
                     label="📥 Download All Profiles CSV",
                     data=csv,
@@ -273,8 +419,10 @@ def run_extraction(keyword, limit, verify_emails=True, add_generic_emails=True,
     except Exception as e:
         st.error(f"❌ Extraction failed: {str(e)}")
         debug_info["errors"].append(f"Extraction failed: {str(e)}")
-        st.session_state.debug_info = debug_info
+        store_debug_info(debug_info, keyword, limit)
     finally:
+        if pending_leads:
+            scraper.upsert_leads(pending_leads, keyword=keyword)
         if 'driver' in locals() and driver:
             driver.quit()
 
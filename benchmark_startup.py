@@ -0,0 +1,80 @@
+"""Import-time benchmark for scraper.py
+
+Runs `import scraper` in fresh interpreters and reports the median wall time, the slowest
+top-level imports (from python -X importtime) and the one-off cost of the lazily loaded
+dependencies. Usage: python benchmark_startup.py [--runs N] [--top N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import scraper; "
+    "print(time.perf_counter() - start)"
+)
+
+FIRST_USE_SNIPPET = """
+import time
+import scraper
+
+for name, load in [
+    ("proxycurl client", scraper.get_proxycurl_client),
+    ("tldextract", lambda: scraper.registrable_domain("www.example.co.uk")),
+    ("dns resolver", scraper._get_dns_resolver),
+    ("lxml", lambda: scraper.parse_company_html("<html></html>") if scraper.LXML_AVAILABLE else None),
+]:
+    start = time.perf_counter()
+    load()
+    print(f"{name}\\t{time.perf_counter() - start}")
+"""
+
+def run_python(args):
+    """Run the current interpreter from the repo directory and return the completed process"""
+    return subprocess.run([sys.executable] + args, cwd=HERE, capture_output=True, text=True, check=True)
+
+def time_import(runs):
+    """Wall time of `import scraper` in `runs` fresh interpreters, in seconds"""
+    return [float(run_python(["-c", IMPORT_SNIPPET]).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+
+def slowest_imports(top):
+    """The `top` slowest top-level imports of scraper as (module, cumulative seconds)"""
+    stderr = run_python(["-X", "importtime", "-c", "import scraper"]).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        # importtime indents by two spaces per level: modules imported by scraper itself sit at three
+        if len(module) - len(module.lstrip()) == 3 and cumulative.strip().isdigit():
+            entries.append((module.strip(), int(cumulative) / 1e6))
+    return sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]
+
+def first_use_costs():
+    """One-off load time of each lazily imported dependency as (name, seconds)"""
+    lines = run_python(["-c", FIRST_USE_SNIPPET]).stdout.strip().splitlines()
+    return [(name, float(seconds)) for name, seconds in (line.split("\t") for line in lines if "\t" in line)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    timings = time_import(args.runs)
+    print(f"import scraper: median {statistics.median(timings) * 1000:.0f} ms "
+          f"(min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms, {args.runs} runs)")
+
+    print("\nSlowest imports:")
+    for module, seconds in slowest_imports(args.top):
+        print(f"  {module:<40} {seconds * 1000:7.1f} ms")
+
+    print("\nFirst use of lazily loaded dependencies:")
+    for name, seconds in first_use_costs():
+        print(f"  {name:<40} {seconds * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
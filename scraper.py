@@ -7,31 +7,48 @@ import shutil
 import glob
 import requests
 import re
+import math
 import asyncio
+import sqlite3
+import threading
+import base64
+import functools
+import inspect
+import difflib
+import queue
+import subprocess
+import importlib.util
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs, unquote
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    Retrying, stop_after_attempt, wait_exponential_jitter,
+    retry_if_exception_type, retry_if_result
+)
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from validate_email import validate_email
-import tldextract
-import dns.resolver
-
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from dotenv import load_dotenv
 
-# Import Proxycurl
-try:
-    from proxycurl.asyncio import Proxycurl
-    PROXYCURL_AVAILABLE = True
-except ImportError:
-    PROXYCURL_AVAILABLE = False
+# Heavy optional dependencies (Proxycurl's aiohttp client, lxml, dnspython, tldextract,
+# webdriver_manager) are only located here and imported on first use, so importing this
+# module stays cheap for the Streamlit UI
+PROXYCURL_AVAILABLE = all(importlib.util.find_spec(name) for name in ("proxycurl", "aiohttp"))
+if not PROXYCURL_AVAILABLE:
     print("Proxycurl not available. Install with: pip install 'proxycurl-py[asyncio]'")
 
+# lxml for offline page parsing
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+if not LXML_AVAILABLE:
+    print("lxml not available. Install with: pip install lxml cssselect")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,31 +59,588 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Initialize Proxycurl API client if available
-proxycurl_client = None
+# Proxycurl API client, created by get_proxycurl_client on first use
 PROXYCURL_API_KEY = os.getenv("PROXYCURL_API_KEY")
+# Override the API host, e.g. to point at a local mock server
+PROXYCURL_BASE_URL = os.getenv("PROXYCURL_BASE_URL", "https://nubela.co")
+# Batch enrichment: profiles enriched at once and API requests per second across all of them
+PROXYCURL_CONCURRENCY = int(os.getenv("PROXYCURL_CONCURRENCY", "5"))
+PROXYCURL_RATE_LIMIT = float(os.getenv("PROXYCURL_RATE_LIMIT", "5"))
 
-if PROXYCURL_API_KEY and PROXYCURL_AVAILABLE:
+@functools.lru_cache(maxsize=None)
+def get_proxycurl_client():
+    """The shared Proxycurl client, imported and initialized on first use (None if unavailable)"""
+    if not PROXYCURL_AVAILABLE:
+        return None
+    if not PROXYCURL_API_KEY:
+        logger.warning("PROXYCURL_API_KEY not found in environment variables")
+        return None
     # Set the API key in the environment
     os.environ["PROXYCURL_API_KEY"] = PROXYCURL_API_KEY
     try:
-        proxycurl_client = Proxycurl()
+        from proxycurl.asyncio import Proxycurl
+        # Pass the key explicitly: the client reads its default before load_dotenv runs
+        client = Proxycurl(api_key=PROXYCURL_API_KEY, base_url=PROXYCURL_BASE_URL)
         logger.info("Proxycurl client initialized successfully")
+        return client
     except Exception as e:
         logger.error(f"Failed to initialize Proxycurl client: {str(e)}")
-        proxycurl_client = None
-elif PROXYCURL_AVAILABLE:
-    logger.warning("PROXYCURL_API_KEY not found in environment variables")
-    
-# Verify environment variables are loading correctly
-logger.info(f"LinkedIn email exists: {bool(os.getenv('LINKEDIN_EMAIL'))}")
-logger.info(f"LinkedIn password exists: {bool(os.getenv('LINKEDIN_PASSWORD'))}")
-logger.info(f"Proxycurl API key exists: {bool(os.getenv('PROXYCURL_API_KEY'))}")
+        return None
+
+def log_environment_status():
+    """Verify environment variables are loading correctly"""
+    logger.info(f"LinkedIn email exists: {bool(os.getenv('LINKEDIN_EMAIL'))}")
+    logger.info(f"LinkedIn password exists: {bool(os.getenv('LINKEDIN_PASSWORD'))}")
+    logger.info(f"Proxycurl API key exists: {bool(os.getenv('PROXYCURL_API_KEY'))}")
 
 # Define constants for cookie management
 COOKIE_FILE = "linkedin_cookies.json"
 APOLLO_API_KEY = os.getenv("APOLLO_API_KEY")
 
+# Third-party HTTP APIs: (connect, read) timeout in seconds, attempts per request,
+# keep-alive connections per host, and requests per second allowed per host
+HTTP_TIMEOUT = (float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")), float(os.getenv("HTTP_READ_TIMEOUT", "20")))
+HTTP_MAX_ATTEMPTS = int(os.getenv("HTTP_MAX_ATTEMPTS", "4"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+HTTP_HOST_RATES = {
+    "api.apollo.io": float(os.getenv("APOLLO_RATE_LIMIT", "2")),
+    "api.github.com": float(os.getenv("GITHUB_RATE_LIMIT", "1"))
+}
+HTTP_DEFAULT_RATE = float(os.getenv("HTTP_DEFAULT_RATE", "5"))
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Extraction pipeline: items allowed to wait between stages (back-pressure on the browser)
+# and worker threads for the domain verification and email resolution stages
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+PIPELINE_DNS_WORKERS = int(os.getenv("PIPELINE_DNS_WORKERS", "4"))
+PIPELINE_EMAIL_WORKERS = int(os.getenv("PIPELINE_EMAIL_WORKERS", "4"))
+
+# Local data directory (mounted at /app/data in Docker) and the SQLite file used by the on-disk caches
+DATA_DIR = os.getenv("DATA_DIR", "data")
+CACHE_DB = os.getenv("CACHE_DB", os.path.join(DATA_DIR, "cache.db"))
+
+# Public suffix list: tldextract's bundled snapshot only (never fetched over the network),
+# with its parsed cache kept under the data directory
+TLDEXTRACT_CACHE_DIR = os.getenv("TLDEXTRACT_CACHE_DIR", os.path.join(DATA_DIR, "tldextract"))
+
+# DNS verdict cache: positive entries live for the record TTL (at least DNS_MIN_TTL),
+# negative entries (no MX and no A records) for DNS_NEGATIVE_TTL seconds
+DNS_MIN_TTL = int(os.getenv("DNS_MIN_TTL", "300"))
+DNS_NEGATIVE_TTL = int(os.getenv("DNS_NEGATIVE_TTL", "3600"))
+
+# Batched async DNS checks: concurrent queries in flight, per-query timeout in seconds,
+# and optional nameservers (comma-separated IPs) / port, e.g. a local stub server for testing
+DNS_MAX_IN_FLIGHT = int(os.getenv("DNS_MAX_IN_FLIGHT", "10"))
+DNS_QUERY_TIMEOUT = float(os.getenv("DNS_QUERY_TIMEOUT", "3"))
+DNS_NAMESERVERS = [ns.strip() for ns in os.getenv("DNS_NAMESERVERS", "").split(",") if ns.strip()]
+DNS_PORT = int(os.getenv("DNS_PORT", "53"))
+
+EMAIL_FORMAT_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dns_cache (
+    domain TEXT PRIMARY KEY,
+    verdict INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS email_formats (
+    domain TEXT NOT NULL,
+    format TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (domain, format)
+);
+CREATE TABLE IF NOT EXISTS company_cache (
+    cache_key TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS api_cache (
+    cache_key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    response TEXT,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_api_cache_last_access ON api_cache (last_access);
+CREATE TABLE IF NOT EXISTS leads (
+    profile_url TEXT PRIMARY KEY,
+    name TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    company_domain TEXT,
+    email TEXT,
+    email_source TEXT,
+    keyword TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leads_company_domain ON leads (company_domain);
+CREATE INDEX IF NOT EXISTS idx_leads_email ON leads (email);
+CREATE TABLE IF NOT EXISTS company_domains (
+    name TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    source TEXT NOT NULL,
+    confirmations INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_company_domains_domain ON company_domains (domain);
+"""
+
+# Lead store: profiles enriched within this many days are reused instead of enriched again,
+# and finished profiles are written in batches of LEAD_STORE_BATCH_SIZE
+LEAD_FRESHNESS_DAYS = float(os.getenv("LEAD_FRESHNESS_DAYS", "30"))
+LEAD_STORE_BATCH_SIZE = int(os.getenv("LEAD_STORE_BATCH_SIZE", "20"))
+LEAD_FIELDS = ("name", "first_name", "last_name", "company_domain", "email", "email_source")
+
+# Proxycurl/Apollo response cache: TTL in seconds per endpoint, TTL for misses
+# (empty responses), and the entry cap enforced by evicting least recently used rows
+API_CACHE_TTLS = {
+    "proxycurl_person": int(os.getenv("API_CACHE_TTL_PERSON", str(7 * 24 * 3600))),
+    "proxycurl_company": int(os.getenv("API_CACHE_TTL_COMPANY", str(30 * 24 * 3600))),
+    "proxycurl_email": int(os.getenv("API_CACHE_TTL_EMAIL", str(14 * 24 * 3600))),
+    "apollo_match": int(os.getenv("API_CACHE_TTL_APOLLO", str(14 * 24 * 3600)))
+}
+API_CACHE_NEGATIVE_TTL = int(os.getenv("API_CACHE_NEGATIVE_TTL", str(24 * 3600)))
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "5000"))
+
+# How long a company website domain resolved from a company page / Proxycurl stays cached
+COMPANY_CACHE_TTL = int(os.getenv("COMPANY_CACHE_TTL", str(30 * 24 * 3600)))
+
+# Company name -> domain index: companies known up front, an optional CSV of "name,domain"
+# lines loaded when the database is opened, and how close a fuzzy name match has to be
+COMPANY_DOMAIN_SEED = {
+    'google': 'google.com',
+    'microsoft': 'microsoft.com',
+    'apple': 'apple.com',
+    'amazon': 'amazon.com',
+    'facebook': 'facebook.com',
+    'meta': 'meta.com',
+    'netflix': 'netflix.com',
+    'uber': 'uber.com',
+    'linkedin': 'linkedin.com',
+    'twitter': 'twitter.com',
+    'tesla': 'tesla.com',
+    'intel': 'intel.com',
+    'amd': 'amd.com',
+    'nvidia': 'nvidia.com',
+    'ibm': 'ibm.com',
+    'oracle': 'oracle.com',
+    'salesforce': 'salesforce.com',
+    'paypal': 'paypal.com',
+    'adobe': 'adobe.com',
+    'cisco': 'cisco.com',
+    'ethereum': 'ethereum.org',
+    'bitcoin': 'bitcoin.org',
+    'perforce': 'perforce.com'
+}
+COMPANY_INDEX_FILE = os.getenv("COMPANY_INDEX_FILE")
+COMPANY_FUZZY_CUTOFF = float(os.getenv("COMPANY_FUZZY_CUTOFF", "0.88"))
+
+# Email local-part formats, in the order they are matched when learning a company's format
+EMAIL_FORMATS = {
+    "first.last": lambda first, last: f"{first}.{last}",
+    "firstlast": lambda first, last: f"{first}{last}",
+    "flast": lambda first, last: f"{first[0]}{last}",
+    "last.first": lambda first, last: f"{last}.{first}",
+    "lastfirst": lambda first, last: f"{last}{first}",
+    "lastf": lambda first, last: f"{last}{first[0]}",
+    "first-last": lambda first, last: f"{first}-{last}",
+    "first_last": lambda first, last: f"{first}_{last}",
+    "first.l": lambda first, last: f"{first}.{last[0]}",
+    "f.last": lambda first, last: f"{first[0]}.{last}",
+    "first": lambda first, last: first,
+}
+
+# Debug screenshots: "off", "on_error" (failures only), "sampled" (failures plus a
+# SCREENSHOT_SAMPLE_RATE fraction of the others) or "always"
+SCREENSHOT_MODE = os.getenv("SCREENSHOT_MODE", "on_error").lower()
+SCREENSHOT_SAMPLE_RATE = float(os.getenv("SCREENSHOT_SAMPLE_RATE", "0.1"))
+SCREENSHOT_DIR = os.getenv("SCREENSHOT_DIR", os.path.join(DATA_DIR, "screenshots"))
+
+# Per-run JSONL journals of finished profiles, used to resume an interrupted run
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", os.path.join(DATA_DIR, "runs"))
+
+# Chrome and ChromeDriver: an explicit CHROMEDRIVER_PATH is used as is; otherwise the
+# preinstalled driver is used when its major version matches Chrome, and webdriver_manager
+# only downloads one when it does not. The resolved path is remembered on disk.
+CHROME_BINARY = os.getenv("CHROME_BINARY", "/usr/bin/google-chrome" if os.name == "posix"
+                          else "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe")
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+CHROMEDRIVER_PREINSTALLED = os.getenv("CHROMEDRIVER_PREINSTALLED", "/usr/local/bin/chromedriver")
+CHROMEDRIVER_CACHE_FILE = os.getenv("CHROMEDRIVER_CACHE_FILE", os.path.join(DATA_DIR, "chromedriver.json"))
+
+# Readiness waits after navigation: upper bounds in seconds (pages that are ready earlier move on at once);
+# optional sections such as a profile's experience get OPTIONAL_SECTION_TIMEOUT more once the page is ready
+PAGE_READY_TIMEOUT = float(os.getenv("PAGE_READY_TIMEOUT", "15"))
+OPTIONAL_SECTION_TIMEOUT = float(os.getenv("OPTIONAL_SECTION_TIMEOUT", "3"))
+SCROLL_SETTLE_TIMEOUT = float(os.getenv("SCROLL_SETTLE_TIMEOUT", "4"))
+
+# Profile and company page scans: "lxml" parses page_source once and evaluates the
+# selectors locally, "selenium" runs every selector against the live browser
+PAGE_PARSER = os.getenv("PAGE_PARSER", "lxml").lower()
+
+PROFILE_HEADLINE_XPATHS = [
+    "//div[contains(@class, 'pv-text-details__left-panel')]//h2",
+    "//div[contains(@class, 'ph5')]//h2",
+    "//div[contains(@class, 'profile-info')]//h2",
+    "//div[contains(@class, 'ph5')]//div[contains(@class, 'mt2')]/div",
+    "//div[contains(@class, 'mt2')]//span[contains(@class, 't-semibold')]"
+]
+
+PROFILE_EXPERIENCE_XPATHS = [
+    "//section[contains(@class, 'experience')]//li[contains(@class, 'experience-item')][1]",
+    "//section[contains(@id, 'experience-section')]//li[1]",
+    "//div[contains(@class, 'experience-section')]//li[1]",
+    "//section[@id='experience']//li[1]",
+    "//div[contains(@class, 'pvs-list')]//li[contains(@class, 'artdeco-list__item')][1]"  # New LinkedIn
+]
+
+# Relative to the experience section
+PROFILE_COMPANY_LINK_XPATHS = [
+    ".//a[contains(@href, '/company/') or contains(@data-field, 'experience_company')]",
+    ".//a[contains(@href, '/company/')]",
+    ".//a[contains(@data-control-name, 'background_details_company')]",
+    ".//a[contains(@class, 'optional-action-target-wrapper')]",
+    ".//span[contains(@class, 'enterprise-profile')]/a"
+]
+
+PROFILE_COMPANY_NAME_XPATHS = [
+    "//div[contains(@class, 'experience-item__subtitle')]",
+    "//span[contains(@class, 'experience-item-company')]",
+    "//span[contains(@class, 'pv-entity__secondary-title')]",
+    "//div[contains(@class, 'inline-show-more-text')]",
+    "//span[contains(@class, 'hoverable-link-text')]"
+]
+
+COMPANY_WEBSITE_SELECTORS = [
+    "a[data-control-name='website']",
+    "a[data-control-name='org_about_module_website_link']",
+    "a[data-test-about-company-website-link]",
+    "a[href*='http']:not([href*='linkedin.com'])"
+]
+
+# Search result extraction: "snapshot" reads the whole page in one execute_script call,
+# "legacy" walks the elements one WebDriver call at a time
+SEARCH_EXTRACTION_MODE = os.getenv("SEARCH_EXTRACTION_MODE", "snapshot").lower()
+
+# Search pagination: "direct" opens results pages by number (&page=N), "scroll" scrolls and
+# clicks the Next button; LinkedIn shows at most 100 pages
+SEARCH_PAGINATION_MODE = os.getenv("SEARCH_PAGINATION_MODE", "direct").lower()
+SEARCH_MAX_PAGES = int(os.getenv("SEARCH_MAX_PAGES", "100"))
+
+# Look for both older and newer LinkedIn profile card selectors
+SEARCH_CARD_SELECTORS = [
+    "div[data-chameleon-result-urn]",  # Current LinkedIn
+    "div.entity-result__item",  # Recent LinkedIn
+    "li.reusable-search__result-container",  # Also recent
+    "li.search-result",  # Older LinkedIn
+    "div.search-entity"  # Even older
+]
+
+# Name selectors depending on LinkedIn's structure
+SEARCH_NAME_SELECTORS = [
+    "span.entity-result__title-text",
+    "span.actor-name",
+    "span.artdeco-entity-lockup__title",
+    "span.artdeco-entity-lockup__subtitle",
+    "span[data-test-result-lockup-name]"
+]
+
+# Headline line shown under the name in a search card
+SEARCH_SUBTITLE_SELECTORS = [
+    "div.entity-result__primary-subtitle",
+    "div.artdeco-entity-lockup__subtitle",
+    "p.subline-level-1"
+]
+
+# "Current: ... at ..." line some cards show below the headline
+SEARCH_SUMMARY_SELECTORS = [
+    "p.entity-result__summary",
+    "div.entity-result__summary",
+    "p.entity-result__summary--2-lines"
+]
+
+# Returns one entry per profile link:
+# {url, name, card_names, span_texts, subtitle, summary, company_url, company_text, card_index}
+SEARCH_SNAPSHOT_JS = """
+const cardSelectors = arguments[0];
+const nameSelectors = arguments[1];
+const subtitleSelectors = arguments[2];
+const summarySelectors = arguments[3];
+const text = (el) => (el && el.innerText ? el.innerText.trim() : "");
+const firstText = (root, selectors) => {
+    for (const selector of selectors) {
+        const el = root.querySelector(selector);
+        const value = text(el);
+        if (value) return value;
+    }
+    return "";
+};
+
+const cards = [];
+for (const selector of cardSelectors) {
+    document.querySelectorAll(selector).forEach((card) => {
+        if (!cards.includes(card)) cards.push(card);
+    });
+}
+
+const results = [];
+document.querySelectorAll("a[href*='/in/']").forEach((link) => {
+    const cardIndex = cards.findIndex((card) => card.contains(link));
+    const card = cardIndex >= 0 ? cards[cardIndex] : null;
+
+    const cardNames = [];
+    const parent = link.parentElement;
+    if (parent) {
+        const parentName = parent.querySelector("span.entity-result__title-text, span.actor-name, span.name");
+        if (text(parentName)) cardNames.push(text(parentName));
+    }
+    if (card) {
+        const cardName = firstText(card, nameSelectors);
+        if (cardName) cardNames.push(cardName);
+    }
+
+    const companyLink = card ? card.querySelector("a[href*='/company/']") : null;
+
+    const spanTexts = [];
+    let ancestor = link.parentElement;
+    for (let level = 0; level < 3 && ancestor; level++) {
+        ancestor.querySelectorAll("span").forEach((span) => spanTexts.push(text(span)));
+        ancestor = ancestor.parentElement;
+    }
+
+    results.push({
+        url: link.href,
+        name: text(link),
+        card_names: cardNames,
+        span_texts: spanTexts,
+        subtitle: card ? firstText(card, subtitleSelectors) : "",
+        summary: card ? firstText(card, summarySelectors) : "",
+        company_url: companyLink ? companyLink.href : "",
+        company_text: text(companyLink),
+        card_index: cardIndex
+    });
+});
+return results;
+"""
+
+_cache_db = None
+_cache_db_lock = threading.RLock()
+
+def get_cache_db():
+    """Open (once) the shared SQLite database used by the on-disk caches"""
+    global _cache_db
+    with _cache_db_lock:
+        if _cache_db is None:
+            cache_dir = os.path.dirname(CACHE_DB)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            _cache_db = sqlite3.connect(CACHE_DB, check_same_thread=False, isolation_level=None)
+            _cache_db.execute("PRAGMA journal_mode=WAL")
+            _cache_db.executescript(CACHE_SCHEMA)
+            _seed_company_index(_cache_db)
+            logger.info(f"Opened cache database at {CACHE_DB}")
+        return _cache_db
+
+# Stage name -> list of durations in seconds
+_stage_samples = {}
+_stage_lock = threading.Lock()
+
+def record_stage(stage, seconds):
+    """Add one duration sample for a pipeline stage"""
+    with _stage_lock:
+        _stage_samples.setdefault(stage, []).append(seconds)
+
+@contextmanager
+def stage_timer(stage):
+    """Time a block of code as one sample of a stage"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started)
+
+def timed_stage(stage):
+    """Decorator recording every call of a (sync, async or generator) function as a stage sample"""
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                # Only the generator's own steps count, not the time the consumer holds each item
+                generator = func(*args, **kwargs)
+                elapsed = 0.0
+                try:
+                    while True:
+                        started = time.perf_counter()
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                        finally:
+                            elapsed += time.perf_counter() - started
+                        yield item
+                finally:
+                    generator.close()
+                    record_stage(stage, elapsed)
+            return generator_wrapper
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage_timer(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def get_stage_metrics():
+    """Per-stage count, total, mean, p50, p95 and max duration in seconds"""
+    with _stage_lock:
+        samples = {stage: sorted(values) for stage, values in _stage_samples.items()}
+    metrics = {}
+    for stage, values in samples.items():
+        total = sum(values)
+        metrics[stage] = {
+            "count": len(values),
+            "total_s": round(total, 3),
+            "mean_s": round(total / len(values), 3),
+            "p50_s": round(_percentile(values, 0.50), 3),
+            "p95_s": round(_percentile(values, 0.95), 3),
+            "max_s": round(values[-1], 3)
+        }
+    return metrics
+
+def reset_stage_metrics():
+    """Clear all stage samples (call at the start of a run)"""
+    with _stage_lock:
+        _stage_samples.clear()
+
+def export_stage_metrics(path=None, **metadata):
+    """Stage metrics as a JSON document for comparing runs; also written to path if given"""
+    document = {
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "metadata": metadata,
+        "stages": get_stage_metrics()
+    }
+    content = json.dumps(document, indent=2, default=str)
+    if path:
+        with open(path, "w") as f:
+            f.write(content)
+    return content
+
+# Screenshots are decoded and written to disk on a background thread
+_screenshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshots")
+_screenshot_run = {"dir": None, "count": 0}
+
+def start_screenshot_run(run_id=None):
+    """Start a new per-run screenshot directory under SCREENSHOT_DIR and return its path"""
+    run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+    _screenshot_run["dir"] = os.path.join(SCREENSHOT_DIR, run_id)
+    _screenshot_run["count"] = 0
+    return _screenshot_run["dir"]
+
+def _should_capture(error):
+    """Decide whether a screenshot is taken under the current SCREENSHOT_MODE"""
+    if SCREENSHOT_MODE == "always":
+        return True
+    if SCREENSHOT_MODE == "off":
+        return False
+    if error:
+        return True
+    return SCREENSHOT_MODE == "sampled" and random.random() < SCREENSHOT_SAMPLE_RATE
+
+def _write_screenshot(path, encoded_png):
+    """Decode and write a screenshot (runs on the background thread)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(base64.b64decode(encoded_png))
+        logger.debug(f"Saved screenshot {path}")
+    except Exception as e:
+        logger.warning(f"Failed to write screenshot {path}: {str(e)}")
+
+def capture_screenshot(driver, name, error=False):
+    """Take a debug screenshot if SCREENSHOT_MODE allows it; returns the file path or None
+
+    The capture itself has to run on the driver's thread, but decoding and writing
+    the file happen in the background.
+    """
+    if not driver or not _should_capture(error):
+        return None
+    try:
+        encoded_png = driver.get_screenshot_as_base64()
+    except Exception as e:
+        logger.warning(f"Screenshot failed, but continuing: {str(e)}")
+        return None
+    if not _screenshot_run["dir"]:
+        start_screenshot_run()
+    _screenshot_run["count"] += 1
+    path = os.path.join(_screenshot_run["dir"], f"{_screenshot_run['count']:04d}_{name}.png")
+    _screenshot_executor.submit(_write_screenshot, path, encoded_png)
+    return path
+
+class RunJournal:
+    """Append-only JSONL file with one record per finished profile of a run"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Terminate a line cut short by a crash so new records start on a fresh line
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb+") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+
+    def append(self, record):
+        """Write one record and flush it to disk right away"""
+        line = json.dumps(record, default=str)
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self):
+        """All complete records; a line cut short by a crash is skipped"""
+        records = []
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping unreadable journal line in {self.path}")
+        return records
+
+def _journal_prefix(keyword):
+    return re.sub(r'[^a-z0-9]+', '-', (keyword or "").lower()).strip('-') or "run"
+
+def open_run_journal(keyword, resume=False):
+    """Journal for a search run: the latest one for this keyword when resuming, else a new one"""
+    prefix = _journal_prefix(keyword)
+    if resume:
+        pattern = re.compile(rf"{re.escape(prefix)}-\d{{8}}-\d{{6}}\.jsonl$")
+        existing = sorted(path for path in glob.glob(os.path.join(JOURNAL_DIR, f"{prefix}-*.jsonl"))
+                          if pattern.match(os.path.basename(path)))
+        if existing:
+            logger.info(f"Resuming run journal {existing[-1]}")
+            return RunJournal(existing[-1])
+        logger.info(f"No journal to resume for '{keyword}', starting a new run")
+    return RunJournal(os.path.join(JOURNAL_DIR, f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"))
+
 def save_cookies(driver, filename=COOKIE_FILE):
     """Save browser cookies to a file"""
     try:
@@ -221,13 +795,106 @@ def configure_chrome_options(use_profile=False):
                 logger.warning(f"Chrome profile not found at {source_profile}")
     
     # Specify Chrome binary location
-    if os.name == 'posix':  # Linux/Mac
-        options.binary_location = '/usr/bin/google-chrome'
-    else:  # Windows
-        options.binary_location = 'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe'
+    options.binary_location = CHROME_BINARY
     
     return options
 
+def _binary_version(path):
+    """Version string reported by `<path> --version` (Chrome or ChromeDriver), or None"""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except Exception as e:
+        logger.warning(f"Could not read the version of {path}: {str(e)}")
+        return None
+    match = re.search(r"\d+(?:\.\d+)+", output)
+    return match.group(0) if match else None
+
+def _file_fingerprint(path):
+    """[path, mtime, size] of a file, or None when it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [path, stat.st_mtime, stat.st_size]
+
+def _load_chromedriver_cache():
+    """The remembered driver resolution, or {} when there is none"""
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_chromedriver_cache(entry):
+    """Remember a driver resolution for later processes"""
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_FILE) or ".", exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_FILE, "w") as f:
+            json.dump(entry, f)
+    except Exception as e:
+        logger.warning(f"Could not save ChromeDriver cache: {str(e)}")
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver():
+    """Path of the ChromeDriver to use, resolved once per process (None lets Selenium choose)
+
+    A remembered resolution is reused without running anything while neither the Chrome
+    binary nor the driver has changed, so login does not need the driver download CDN.
+    """
+    if CHROMEDRIVER_PATH:
+        logger.info(f"Using configured ChromeDriver at {CHROMEDRIVER_PATH}")
+        return CHROMEDRIVER_PATH
+
+    chrome = _file_fingerprint(CHROME_BINARY)
+    cached = _load_chromedriver_cache()
+    driver_path = cached.get("driver")
+    unchanged = chrome and cached.get("chrome") == chrome and cached.get("preinstalled") == CHROMEDRIVER_PREINSTALLED
+    if unchanged and driver_path and cached.get("driver_fingerprint") == _file_fingerprint(driver_path):
+        logger.info(f"Using cached ChromeDriver {cached.get('driver_version')} at {driver_path}")
+        return driver_path
+
+    chrome_version = _binary_version(CHROME_BINARY) if chrome else None
+    chrome_major = chrome_version.split(".")[0] if chrome_version else None
+    candidates = []
+    for path in (CHROMEDRIVER_PREINSTALLED, shutil.which("chromedriver")):
+        if path and os.path.isfile(path) and path not in candidates:
+            candidates.append(path)
+
+    driver_path = driver_version = None
+    for path in candidates:
+        version = _binary_version(path)
+        if version and (not chrome_major or version.split(".")[0] == chrome_major):
+            driver_path, driver_version = path, version
+            break
+        logger.warning(f"ChromeDriver {version} at {path} does not match Chrome {chrome_version}")
+
+    if not driver_path:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            logger.info("Using ChromeDriverManager to get ChromeDriver matching current Chrome version")
+            driver_path = ChromeDriverManager().install()
+            driver_version = _binary_version(driver_path)
+        except Exception as e:
+            logger.warning(f"ChromeDriverManager failed: {str(e)}")
+            # Offline: a mismatched preinstalled driver beats none at all
+            driver_path = candidates[0] if candidates else None
+            if driver_path:
+                logger.warning(f"Falling back to ChromeDriver at {driver_path}")
+            return driver_path
+
+    logger.info(f"Using ChromeDriver {driver_version} at {driver_path} for Chrome {chrome_version}")
+    if chrome:
+        _save_chromedriver_cache({"chrome": chrome, "chrome_version": chrome_version,
+                                  "preinstalled": CHROMEDRIVER_PREINSTALLED, "driver": driver_path,
+                                  "driver_version": driver_version,
+                                  "driver_fingerprint": _file_fingerprint(driver_path)})
+    return driver_path
+
+def chrome_service():
+    """Selenium Service for the resolved ChromeDriver"""
+    driver_path = resolve_chromedriver()
+    return Service(driver_path) if driver_path else Service()
+
 def simulate_human_behavior(driver):
     """Simulate random mouse movements and scrolling to mimic human behavior"""
     try:
@@ -280,6 +947,7 @@ def check_login_status(driver):
         logger.warning(f"Error checking login status: {str(e)}")
         return False
 
+@timed_stage("login")
 def linkedin_login():
     """Login to LinkedIn with robust error handling and retry logic"""
     # First, try using cookies if available
@@ -288,7 +956,7 @@ def linkedin_login():
         if os.path.exists(COOKIE_FILE):
             logger.info("Attempting login with saved cookies")
             options = configure_chrome_options()
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service()
             driver = webdriver.Chrome(service=service, options=options)
             
             # Add stealth scripts
@@ -319,7 +987,7 @@ def linkedin_login():
     try:
         logger.info("Attempting login with browser profile")
         options = configure_chrome_options(use_profile=True)
-        service = Service(ChromeDriverManager().install())
+        service = chrome_service()
         driver = webdriver.Chrome(service=service, options=options)
         
         # Add stealth scripts
@@ -352,9 +1020,8 @@ def linkedin_login():
         try:
             # Initialize WebDriver with explicit error handling
             try:
-                # Use webdriver-manager to automatically get the correct ChromeDriver version
-                logger.info("Using ChromeDriverManager to get ChromeDriver matching current Chrome version")
-                service = Service(ChromeDriverManager().install())
+                # ChromeDriver is resolved once per process and reused across retries
+                service = chrome_service()
                 driver = webdriver.Chrome(service=service, options=options)
                 
                 # Apply stealth script
@@ -417,10 +1084,7 @@ def linkedin_login():
                     raise Exception("LinkedIn credentials not found in environment variables")
                 
                 # Take screenshot before login attempt (for debugging)
-                try:
-                    driver.save_screenshot("before_login.png")
-                except Exception as ss_err:
-                    logger.warning(f"Screenshot failed, but continuing: {str(ss_err)}")
+                capture_screenshot(driver, "before_login")
                 
                 # Enter credentials with more human-like typing (variable speed)
                 email_field = driver.find_element(By.ID, "username")
@@ -464,20 +1128,14 @@ def linkedin_login():
                     )
                     
                     # Take screenshot after login (for debugging)
-                    try:
-                        driver.save_screenshot("after_login.png")
-                    except Exception as ss_err:
-                        logger.warning(f"Screenshot failed, but continuing: {str(ss_err)}")
+                    capture_screenshot(driver, "after_login")
                     
                     # Check for login issues
                     current_url = driver.current_url.lower()
                     
                     if any(x in current_url for x in ["checkpoint", "challenge"]):
                         logger.warning("LinkedIn security checkpoint detected")
-                        try:
-                            driver.save_screenshot("linkedin_checkpoint.png")
-                        except Exception:
-                            pass
+                        capture_screenshot(driver, "linkedin_checkpoint", error=True)
                         raise Exception("LinkedIn security checkpoint detected - manual verification required")
                     
                     if "login-submit" in current_url:
@@ -496,17 +1154,11 @@ def linkedin_login():
                         return driver
                     
                     # Unknown redirect
-                    try:
-                        driver.save_screenshot("unknown_redirect.png")
-                    except Exception:
-                        pass
+                    capture_screenshot(driver, "unknown_redirect", error=True)
                     raise Exception(f"Unknown redirect after login: {current_url}")
                     
                 except TimeoutException:
-                    try:
-                        driver.save_screenshot("login_timeout.png")
-                    except Exception:
-                        pass
+                    capture_screenshot(driver, "login_timeout", error=True)
                     logger.warning(f"Login timeout on attempt {retry_count + 1} of {max_retries}")
                     if retry_count < max_retries - 1:
                         retry_count += 1
@@ -516,18 +1168,12 @@ def linkedin_login():
                         raise Exception("Login timeout - LinkedIn may be blocking automated logins")
                     
             except NoSuchElementException as e:
-                try:
-                    driver.save_screenshot("missing_element.png")
-                except Exception:
-                    pass
+                capture_screenshot(driver, "missing_element", error=True)
                 raise Exception(f"Could not find login page elements: {str(e)}")
                 
         except WebDriverException as e:
             if 'driver' in locals():
-                try:
-                    driver.save_screenshot(f"webdriver_error_{retry_count}.png")
-                except Exception:
-                    pass
+                capture_screenshot(driver, f"webdriver_error_{retry_count}", error=True)
                 driver.quit()
             
             logger.warning(f"WebDriver error on attempt {retry_count + 1}: {str(e)}")
@@ -540,10 +1186,7 @@ def linkedin_login():
                 
         except Exception as e:
             if 'driver' in locals():
-                try:
-                    driver.save_screenshot(f"login_error_{retry_count}.png")
-                except Exception:
-                    pass
+                capture_screenshot(driver, f"login_error_{retry_count}", error=True)
                 driver.quit()
             
             logger.warning(f"Error on attempt {retry_count + 1}: {str(e)}")
@@ -659,32 +1302,211 @@ def apply_stealth_scripts(driver):
     except Exception as e:
         logger.warning(f"CDP command failed, but continuing: {str(e)}")
 
+# CSS selectors that mean a page is ready to be read, per page type. Search results need a
+# result card (or the no-results notice), profiles the top card (not every profile has an
+# experience section) and company pages the top card or about module. Generic elements
+# such as main or external links are already in the page shell and must not be listed.
+READY_SELECTORS = {
+    "search_results": SEARCH_CARD_SELECTORS + [
+        "div.search-reusable-search-no-results",
+        "section.search-no-results"
+    ],
+    "profile": [
+        "section.pv-top-card",
+        "div.pv-text-details__left-panel",
+        "main div.ph5"
+    ],
+    "company": [
+        "section.org-top-card",
+        "div.org-top-card-summary",
+        "section.org-about-module"
+    ]
+}
+
+# Sections that load after a page is ready and are worth a short extra wait, when present
+OPTIONAL_READY_SELECTORS = {
+    "profile": [
+        "#experience",
+        "section[id*='experience']",
+        "section.experience",
+        "div.experience-section",
+        "div.pvs-list"
+    ]
+}
+
+# One entry per wait: {"condition", "seconds", "ready"}
+_wait_log = []
+
+def _record_wait(condition, started, ready):
+    """Remember how long a readiness wait actually took"""
+    seconds = time.time() - started
+    _wait_log.append({"condition": condition, "seconds": round(seconds, 3), "ready": ready})
+    record_stage(f"wait:{condition}", seconds)
+    logger.info(f"Waited {seconds:.2f}s for {condition} ({'ready' if ready else 'timed out'})")
+
+def wait_for_page(driver, condition, timeout=None, stale_element=None):
+    """Wait until a page matches its readiness selectors, bounded by timeout; returns True if ready
+
+    stale_element, if given, must first detach from the DOM (used after clicking pagination).
+    """
+    timeout = timeout or PAGE_READY_TIMEOUT
+    started = time.time()
+    try:
+        if stale_element is not None:
+            WebDriverWait(driver, timeout, poll_frequency=0.25).until(EC.staleness_of(stale_element))
+        remaining = max(timeout - (time.time() - started), 0.5)
+        _wait_for_selector(driver, READY_SELECTORS[condition], remaining)
+        ready = True
+    except TimeoutException:
+        ready = False
+    _record_wait(condition, started, ready)
+
+    # A page without the optional section only costs the short extra wait
+    if ready and condition in OPTIONAL_READY_SELECTORS:
+        started = time.time()
+        try:
+            _wait_for_selector(driver, OPTIONAL_READY_SELECTORS[condition], OPTIONAL_SECTION_TIMEOUT)
+            found = True
+        except TimeoutException:
+            found = False
+        _record_wait(f"{condition}_sections", started, found)
+    return ready
+
+def _wait_for_selector(driver, selectors, timeout):
+    """Wait until the document has loaded and matches one of the CSS selectors; raises TimeoutException"""
+    WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+        lambda d: d.execute_script(
+            "return document.readyState !== 'loading' && document.querySelector(arguments[0]) !== null;",
+            ", ".join(selectors)
+        )
+    )
+
+def navigate(driver, url, condition=None, timeout=None):
+    """Load a URL and wait for its readiness condition instead of a fixed sleep"""
+    driver.get(url)
+    if condition:
+        return wait_for_page(driver, condition, timeout)
+    return True
+
+def wait_for_scroll_settle(driver, last_height, timeout=None):
+    """After scrolling, wait for the page height to grow and then hold still; returns the new height"""
+    timeout = timeout or SCROLL_SETTLE_TIMEOUT
+    started = time.time()
+    height = last_height
+    stable_since = None
+    while time.time() - started < timeout:
+        time.sleep(0.25)
+        new_height = driver.execute_script("return document.body.scrollHeight")
+        if new_height != height:
+            height = new_height
+            stable_since = time.time()
+        elif stable_since and time.time() - stable_since >= 0.75:
+            break
+    _record_wait("scroll_height", started, height != last_height)
+    return height
+
+def get_wait_stats():
+    """Per-condition count, total, average and max wait time and number of timeouts"""
+    stats = {}
+    for entry in _wait_log:
+        item = stats.setdefault(entry["condition"], {"count": 0, "total_s": 0.0, "max_s": 0.0, "timeouts": 0})
+        item["count"] += 1
+        item["total_s"] += entry["seconds"]
+        item["max_s"] = max(item["max_s"], entry["seconds"])
+        if not entry["ready"]:
+            item["timeouts"] += 1
+    for item in stats.values():
+        item["total_s"] = round(item["total_s"], 3)
+        item["avg_s"] = round(item["total_s"] / item["count"], 3)
+    return stats
+
+def reset_wait_stats():
+    """Clear the recorded readiness waits"""
+    _wait_log.clear()
+
 def search_profiles(driver, keyword, limit=20):
     """Search for LinkedIn profiles with improved traversal and deduplication"""
+    return list(iter_search_profiles(driver, keyword, limit=limit))
+
+def _iter_search_pages(driver, search_url, profiles, processed_urls, limit):
+    """Direct pagination: open results pages by number until the limit is reached or a page adds nothing
+
+    Yields each page's new profiles as one list.
+    """
+    first_page_url = driver.current_url
+    page = 1
+    while len(profiles) < limit and page <= SEARCH_MAX_PAGES:
+        # Page 1 is already open; later pages (and page 1 after the consumer navigated away) by URL
+        if page > 1 or driver.current_url != first_page_url:
+            page_url = f"{search_url}&page={page}" if page > 1 else search_url
+            logger.info(f"Opening results page {page}: {page_url}")
+            navigate(driver, page_url, "search_results")
+            if "checkpoint" in driver.current_url.lower() or "challenge" in driver.current_url.lower():
+                capture_screenshot(driver, "search_checkpoint", error=True)
+                raise Exception("LinkedIn security checkpoint detected during search")
+        
+        # One scroll so lazily rendered cards at the bottom of the page are in the DOM
+        last_height = driver.execute_script("return document.body.scrollHeight")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        wait_for_scroll_settle(driver, last_height)
+        
+        profiles_count_before = len(profiles)
+        extract_profiles_from_page(driver, profiles, processed_urls, limit)
+        new_profiles = profiles.since(profiles_count_before)
+        logger.info(f"Found {len(new_profiles)} new profiles on page {page}")
+        if not new_profiles:
+            logger.info(f"No new profiles on page {page}, assuming the end of the results")
+            break
+        
+        yield new_profiles
+        page += 1
+        
+        # Add random delays to appear more human-like
+        time.sleep(random.uniform(1.0, 3.0))
+
+def iter_search_profiles(driver, keyword, limit=20, on_batch=None, pagination=None):
+    """Generator variant of search_profiles that yields each profile as soon as it is extracted
+
+    on_batch, if given, is called with each page's new profiles before they are yielded. The
+    consumer may use the driver between profiles; the search page is reloaded before the next scroll.
+    pagination overrides SEARCH_PAGINATION_MODE ("direct" or "scroll").
+    """
+    for new_profiles in _iter_search_batches(driver, keyword, limit, pagination):
+        # Called here rather than in the search generator so its time isn't counted as "search"
+        if on_batch:
+            on_batch(new_profiles)
+        yield from new_profiles
+
+@timed_stage("search")
+def _iter_search_batches(driver, keyword, limit, pagination=None):
+    """The search itself: yields the new profiles of each results page or scroll as a list"""
+    pagination = pagination or SEARCH_PAGINATION_MODE
     try:
         logger.info(f"Starting search for '{keyword}' with limit of {limit} profiles")
         query = keyword.replace(" ", "%20")
         search_url = f"https://www.linkedin.com/search/results/people/?keywords={query}"
         logger.info(f"Navigating to search URL: {search_url}")
-        driver.get(search_url)
-        time.sleep(5)  # Increased initial wait time
+        navigate(driver, search_url, "search_results")
+        search_page_url = driver.current_url
         
         # Take screenshot of search page for debugging
-        try:
-            driver.save_screenshot("search_page.png")
-            logger.info("Saved screenshot of search page")
-        except Exception as e:
-            logger.warning(f"Failed to save search page screenshot: {str(e)}")
+        capture_screenshot(driver, "search_page")
         
         # Check if we need to handle any captcha or verification
         if "checkpoint" in driver.current_url.lower() or "challenge" in driver.current_url.lower():
             logger.error("LinkedIn security checkpoint detected during search")
-            driver.save_screenshot("search_checkpoint.png")
+            capture_screenshot(driver, "search_checkpoint", error=True)
             raise Exception("LinkedIn security checkpoint detected during search")
         
         # Use a set to track profile URLs and avoid duplicates
         processed_urls = set()
-        profiles = []
+        profiles = ProfileIndex()
+        
+        if pagination == "direct":
+            yield from _iter_search_pages(driver, search_url, profiles, processed_urls, limit)
+            logger.info(f"Search completed. Found {len(profiles)} profiles out of requested {limit}")
+            return
+        
         scroll_attempts = 0
         max_scroll_attempts = 10
         consecutive_no_new_profiles = 0
@@ -709,9 +1531,20 @@ def search_profiles(driver, keyword, limit=20):
             new_profiles_count = len(profiles) - profiles_count_before
             logger.info(f"Found {new_profiles_count} new profiles in this scroll")
             
+            # Hand the new profiles to the consumer right away
+            new_profiles = profiles.since(profiles_count_before)
+            if new_profiles:
+                yield new_profiles
+            
             # If we found enough profiles, break
             if len(profiles) >= limit:
                 break
+            
+            # The consumer may have navigated away while handling the yielded profiles
+            if driver.current_url != search_page_url:
+                logger.info(f"Returning to search results: {search_page_url}")
+                navigate(driver, search_page_url, "search_results")
+                last_height = driver.execute_script("return document.body.scrollHeight")
                 
             # Update consecutive no new profiles counter
             if new_profiles_count == 0:
@@ -723,10 +1556,9 @@ def search_profiles(driver, keyword, limit=20):
             # Scroll down
             logger.info(f"Scrolling down (attempt {scroll_attempts + 1}/{max_scroll_attempts})")
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(2.0, 4.0))  # Increased wait time
             
-            # Check if we've scrolled
-            new_height = driver.execute_script("return document.body.scrollHeight")
+            # Check if we've scrolled (waits for lazy-loaded results to settle)
+            new_height = wait_for_scroll_settle(driver, last_height)
             if new_height == last_height:
                 logger.info("No change in page height after scrolling")
                 scroll_attempts += 1
@@ -746,8 +1578,12 @@ def search_profiles(driver, keyword, limit=20):
                     
                     if show_more_buttons and show_more_buttons[0].is_displayed() and show_more_buttons[0].is_enabled():
                         logger.info("Clicking 'Show more' or 'Next' button")
+                        current_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/in/']")
                         show_more_buttons[0].click()
-                        time.sleep(3)
+                        wait_for_page(driver, "search_results",
+                                      stale_element=current_links[0] if current_links else None)
+                        search_page_url = driver.current_url
+                        last_height = driver.execute_script("return document.body.scrollHeight")
                         # Reset scroll attempts when pagination succeeds
                         scroll_attempts = 0
                         consecutive_no_new_profiles = 0
@@ -762,29 +1598,235 @@ def search_profiles(driver, keyword, limit=20):
             time.sleep(random.uniform(1.0, 3.0))
         
         logger.info(f"Search completed. Found {len(profiles)} profiles out of requested {limit}")
-        return profiles[:limit]
     except Exception as e:
         logger.error(f"Profile search failed: {str(e)}")
         # Take error screenshot
-        try:
-            driver.save_screenshot("search_error.png")
-        except:
-            pass
+        capture_screenshot(driver, "search_error", error=True)
         raise Exception(f"Profile search failed: {str(e)}")
 
-def extract_profiles_from_page(driver, profiles, processed_urls, limit):
+# LinkedIn member ids (used in miniProfileUrn links) are case-sensitive, unlike vanity slugs
+LINKEDIN_MEMBER_ID_RE = re.compile(r'^ACo[A-Za-z0-9_-]+$')
+
+def canonical_profile_url(url):
+    """Canonical https://www.linkedin.com/in/<slug> form of a profile link, or None if it isn't one
+
+    Drops query strings, fragments, trailing slashes and sub-pages, maps locale and mobile
+    subdomains to www, decodes URL-encoded slugs and follows miniProfileUrn links.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    host = parsed.netloc.lower().split(":")[0]
+    if host != "linkedin.com" and not host.endswith(".linkedin.com"):
+        return None
+
+    parts = [unquote(part) for part in parsed.path.split("/") if part]
+    # Only /in/<slug>: an "in" segment further down (e.g. /company/in/...) is not a profile
+    slug = parts[1] if len(parts) > 1 and parts[0].lower() == "in" else None
+    if not slug:
+        urn = parse_qs(parsed.query).get("miniProfileUrn", [""])[0]
+        slug = urn.rsplit(":", 1)[-1] if urn else None
+    slug = (slug or "").strip()
+    if not slug:
+        return None
+    if not LINKEDIN_MEMBER_ID_RE.match(slug):
+        slug = slug.lower()
+    return f"https://www.linkedin.com/in/{slug}"
+
+class Profile:
+    """One search result and what the run found for it (slots keep long runs compact)"""
+
+    __slots__ = ("url", "name", "headline", "company_name", "company_url", "company_source",
+                 "first_name", "last_name", "company_domain", "email", "email_source")
+
+    # Filled in by enrichment, after the search
+    FOUND_FIELDS = ("first_name", "last_name", "company_domain", "email", "email_source")
+
+    def __init__(self, url, name=None, headline=None, company_name=None, company_url=None, company_source=None,
+                 **found):
+        self.url = url
+        self.name = name
+        self.headline = headline
+        self.company_name = company_name
+        self.company_url = company_url
+        # Where the card's company name came from: "link", "summary" or "headline"
+        self.company_source = company_source
+        for field in self.FOUND_FIELDS:
+            setattr(self, field, found.get(field))
+
+    def __repr__(self):
+        return f"Profile({self.name!r}, {self.url!r})"
+
+    def update_from(self, data):
+        """Take the name and found fields that are set in a profile data dict"""
+        for field in ("name",) + self.FOUND_FIELDS:
+            if data.get(field):
+                setattr(self, field, data[field])
+        return self
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: value for field, value in data.items() if field in cls.__slots__})
+
+    def to_row(self):
+        """Columns of this profile in the results tables and CSV exports"""
+        return {
+            "Name": self.name,
+            "LinkedIn": self.url,
+            "First Name": self.first_name,
+            "Last Name": self.last_name,
+            "Company Domain": self.company_domain,
+            "Email": self.email,
+            "Email Source": self.email_source
+        }
+
+class ProfileIndex:
+    """Profiles in the order they were found, indexed by canonical URL for O(1) dedup"""
+
+    __slots__ = ("_by_url", "_order")
+
+    def __init__(self):
+        self._by_url = {}
+        self._order = []
+
+    def add(self, profile):
+        """Add a profile unless one with the same URL is already there; returns whether it was added"""
+        if profile.url in self._by_url:
+            return False
+        self._by_url[profile.url] = profile
+        self._order.append(profile)
+        return True
+
+    def get(self, url):
+        return self._by_url.get(url)
+
+    def since(self, start):
+        """Profiles added after the first `start` ones"""
+        return self._order[start:]
+
+    def __contains__(self, url):
+        return url in self._by_url
+
+    def __len__(self):
+        return len(self._order)
+
+    def __iter__(self):
+        return iter(self._order)
+
+def _profile_name_from_url(profile_url):
+    """Convert a profile URL slug to a name (e.g., john-doe becomes John Doe)"""
+    try:
+        url_parts = unquote(profile_url).split("/in/")[1].split("/")
+        if url_parts and url_parts[0]:
+            return url_parts[0].replace("-", " ").title()
+    except Exception:
+        pass
+    return None
+
+def snapshot_search_results(driver):
+    """Collect every profile link on the current search page in one execute_script call"""
+    entries = driver.execute_script(SEARCH_SNAPSHOT_JS, SEARCH_CARD_SELECTORS, SEARCH_NAME_SELECTORS,
+                                    SEARCH_SUBTITLE_SELECTORS, SEARCH_SUMMARY_SELECTORS)
+    return entries or []
+
+def _pick_snapshot_name(entry, profile_url):
+    """Apply the name fallbacks of the legacy extractor to a snapshot entry"""
+    # Link text first, like the direct link approach
+    name = (entry.get("name") or "").strip()
+    if name:
+        return name
+
+    # Then the name selectors of the parent element or card
+    for candidate in entry.get("card_names") or []:
+        candidate = (candidate or "").strip()
+        if candidate:
+            return candidate
+
+    # Then any span further up that looks like a full name
+    for candidate in entry.get("span_texts") or []:
+        candidate = (candidate or "").strip()
+        if candidate and len(candidate) > 3 and " " in candidate:
+            return candidate
+
+    # Last resort: extract from URL
+    return _profile_name_from_url(profile_url)
+
+def _card_company_data(entry):
+    """Headline, current company and company link shown in a search card, when present"""
+    data = {}
+    headline = (entry.get("subtitle") or "").strip()
+    if headline:
+        data["headline"] = headline
+
+    company_url = (entry.get("company_url") or "").split('?')[0]
+    if "/company/" in company_url:
+        data["company_url"] = company_url
+
+    # Prefer the company link text, then "Current: ... at Company", then the headline
+    company_name = (entry.get("company_text") or "").strip()
+    company_source = "link"
+    if not company_name:
+        summary = (entry.get("summary") or "").strip()
+        if summary.lower().startswith("current:"):
+            company_name = _company_from_headline(summary)
+            company_source = "summary"
+    if not company_name and headline:
+        company_name = _company_from_headline(headline)
+        company_source = "headline"
+    if company_name:
+        data["company_name"] = company_name
+        data["company_source"] = company_source
+    return data
+
+def extract_profiles_from_snapshot(entries, profiles, processed_urls, limit):
+    """Turn snapshot entries into profiles, applying name fallbacks and dedup in Python"""
+    for entry in entries:
+        profile_url = canonical_profile_url(entry.get("url"))
+
+        # Only process LinkedIn profile URLs
+        if not profile_url:
+            continue
+
+        # Skip if we've already processed this URL
+        if profile_url in processed_urls:
+            continue
+        processed_urls.add(profile_url)
+
+        name = _pick_snapshot_name(entry, profile_url)
+        if not name:
+            logger.debug(f"Invalid profile data - Name: '{name}', URL: '{profile_url}'")
+            continue
+
+        if profiles.add(Profile(profile_url, name, **_card_company_data(entry))):
+            logger.info(f"Found profile: {name} at {profile_url}")
+            if len(profiles) >= limit:
+                return
+
+def extract_profiles_from_page(driver, profiles, processed_urls, limit, mode=None):
     """Extract profiles from the current page using multiple methods"""
+    mode = mode or SEARCH_EXTRACTION_MODE
+    if mode == "snapshot":
+        try:
+            entries = snapshot_search_results(driver)
+            card_indexes = {e.get("card_index") for e in entries}
+            cards_found = len([i for i in card_indexes if isinstance(i, int) and i >= 0])
+            logger.info(f"Snapshot returned {len(entries)} profile links from {cards_found} cards")
+            if not cards_found:
+                logger.warning("No profile cards found with any selector")
+                capture_screenshot(driver, "no_cards", error=True)
+            extract_profiles_from_snapshot(entries, profiles, processed_urls, limit)
+            return
+        except Exception as e:
+            logger.warning(f"Snapshot extraction failed, falling back to element lookups: {str(e)}")
+
     # Look for both older and newer LinkedIn profile card selectors
     cards = []
-    selectors = [
-        "div[data-chameleon-result-urn]",  # Current LinkedIn
-        "div.entity-result__item",  # Recent LinkedIn
-        "li.reusable-search__result-container",  # Also recent
-        "li.search-result",  # Older LinkedIn
-        "div.search-entity"  # Even older
-    ]
-    
-    for selector in selectors:
+
+    for selector in SEARCH_CARD_SELECTORS:
         found_cards = driver.find_elements(By.CSS_SELECTOR, selector)
         if found_cards:
             logger.info(f"Found {len(found_cards)} cards with selector: {selector}")
@@ -793,7 +1835,7 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
     if not cards:
         logger.warning("No profile cards found with any selector")
         # Take screenshot for debugging
-        driver.save_screenshot(f"no_cards.png")
+        capture_screenshot(driver, "no_cards", error=True)
     
     # Direct approach: find all profile links on the page
     logger.info("Trying direct link extraction approach")
@@ -806,11 +1848,11 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                 try:
                     profile_url = link.get_attribute("href")
                     if profile_url:
-                        # Clean the URL to remove query params
-                        profile_url = profile_url.split('?')[0]
+                        # Reduce the link to its canonical profile URL (None for other links)
+                        profile_url = canonical_profile_url(profile_url)
                         
                         # Only process LinkedIn profile URLs
-                        if profile_url.startswith("https://www.linkedin.com/in/"):
+                        if profile_url:
                             # Skip if we've already processed this URL
                             if profile_url in processed_urls:
                                 continue
@@ -855,10 +1897,8 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                                     name = name_from_url
                             
                             if name:
-                                profile = {"name": name, "url": profile_url}
-                                if profile not in profiles:
+                                if profiles.add(Profile(profile_url, name)):
                                     logger.info(f"Found profile: {name} at {profile_url}")
-                                    profiles.append(profile)
                                     if len(profiles) >= limit:
                                         return
                 except Exception as e:
@@ -899,7 +1939,10 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                     continue
                 
                 # Get profile URL
-                profile_url = link_element.get_attribute("href").split('?')[0]
+                profile_url = canonical_profile_url(link_element.get_attribute("href"))
+                if not profile_url:
+                    logger.debug("Card link is not a profile URL")
+                    continue
                 
                 # Skip if we've already processed this URL
                 if profile_url in processed_urls:
@@ -911,15 +1954,7 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                 name = None
                 
                 # Try different name selectors depending on LinkedIn's structure
-                name_selectors = [
-                    "span.entity-result__title-text",
-                    "span.actor-name",
-                    "span.artdeco-entity-lockup__title",
-                    "span.artdeco-entity-lockup__subtitle",
-                    "span[data-test-result-lockup-name]"
-                ]
-                
-                for selector in name_selectors:
+                for selector in SEARCH_NAME_SELECTORS:
                     try:
                         elements = card.find_elements(By.CSS_SELECTOR, selector)
                         if elements:
@@ -939,11 +1974,9 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                     if url_parts:
                         name = url_parts[0].replace("-", " ").title()
                 
-                if name and profile_url and profile_url.startswith("https://www.linkedin.com/in/"):
-                    profile = {"name": name, "url": profile_url}
-                    if profile not in profiles:
+                if name and profile_url:
+                    if profiles.add(Profile(profile_url, name)):
                         logger.info(f"Found profile from card: {name} at {profile_url}")
-                        profiles.append(profile)
                         if len(profiles) >= limit:
                             return
                 else:
@@ -952,306 +1985,707 @@ def extract_profiles_from_page(driver, profiles, processed_urls, limit):
                 logger.warning(f"Error processing card: {str(e)}")
                 continue
 
-def extract_company_domain(driver, profile_url):
-    """Extract company domain from profile with enhanced extraction"""
-    try:
-        logger.info(f"Extracting company domain from profile: {profile_url}")
-        driver.get(profile_url)
-        time.sleep(5)  # Increased wait time for profile page to load
-        
-        # Take screenshot for debugging
+def _visible_text_parts(element, parts):
+    """Collect the text of an lxml element, skipping LinkedIn's .visually-hidden screen reader copies"""
+    if "visually-hidden" in (element.get("class") or "").split():
+        return
+    parts.append(element.text or "")
+    for child in element:
+        # Comments and processing instructions contribute only their tail
+        if isinstance(child.tag, str):
+            _visible_text_parts(child, parts)
+        parts.append(child.tail or "")
+
+def _element_text(element):
+    """Visible text of an lxml element with whitespace collapsed, like Selenium's .text"""
+    parts = []
+    _visible_text_parts(element, parts)
+    return " ".join("".join(parts).split())
+
+def _company_from_headline(headline_text):
+    """Extract company name from headline"""
+    if not headline_text:
+        return None
+
+    # Look for common patterns in headlines
+    company_indicators = ["at ", "@ ", "with ", "for ", "- "]
+    for indicator in company_indicators:
+        if indicator in headline_text.lower():
+            parts = headline_text.split(indicator, 1)
+            if len(parts) > 1:
+                # Get the part after the indicator
+                potential_company = parts[1].strip()
+                # Clean up any trailing text after the company name
+                for separator in [" • ", " | ", " - ", " at ", ","]:
+                    if separator in potential_company:
+                        potential_company = potential_company.split(separator, 1)[0].strip()
+
+                logger.info(f"Extracted potential company from headline: {potential_company}")
+                if potential_company and len(potential_company) > 1:
+                    return potential_company
+    return None
+
+def parse_profile_html(html):
+    """Evaluate the profile selector chains against saved page HTML with lxml"""
+    import lxml.html
+
+    # name_from_link: the company name was read from the same link as company_url
+    record = {"headline": None, "company_name": None, "company_url": None, "name_from_link": False}
+    doc = lxml.html.fromstring(html)
+    doc.make_links_absolute("https://www.linkedin.com")
+
+    # Approach 0: First try to extract clean company name from headline or current position
+    for selector in PROFILE_HEADLINE_XPATHS:
+        elements = doc.xpath(selector)
+        if elements:
+            headline_text = _element_text(elements[0])
+            if headline_text:
+                logger.info(f"Found headline text: {headline_text}")
+                record["headline"] = headline_text
+                break
+    record["company_name"] = _company_from_headline(record["headline"])
+
+    # Approach 1: Look for experience section with multiple selectors
+    for selector in PROFILE_EXPERIENCE_XPATHS:
+        sections = doc.xpath(selector)
+        if not sections:
+            continue
+        logger.info(f"Found experience section with selector: {selector}")
+        for link_selector in PROFILE_COMPANY_LINK_XPATHS:
+            company_links = sections[0].xpath(link_selector)
+            if company_links:
+                record["company_url"] = company_links[0].get("href")
+                extracted_company_name = _element_text(company_links[0])
+                if extracted_company_name:
+                    logger.info(f"Found company link: {record['company_url']}, name: {extracted_company_name}")
+                    record["company_name"] = extracted_company_name
+                    record["name_from_link"] = True
+                    break
+        if record["company_url"]:
+            break
+
+    # Approach 2: If we still don't have a company URL, try to find it directly in the page
+    if not record["company_url"]:
+        for link in doc.cssselect("a[href*='/company/']"):
+            href = link.get("href")
+            if href and "/company/" in href:
+                record["company_url"] = href
+                extracted_company_name = _element_text(link)
+                if extracted_company_name:
+                    logger.info(f"Found company via direct link approach: {href}, name: {extracted_company_name}")
+                    if not record["company_name"]:
+                        record["company_name"] = extracted_company_name
+                    record["name_from_link"] = record["company_name"] == extracted_company_name
+                    break
+
+    # If still no company URL, try to at least get company name
+    if not record["company_name"]:
+        for selector in PROFILE_COMPANY_NAME_XPATHS:
+            for element in doc.xpath(selector):
+                text = _element_text(element)
+                if text and len(text) > 1 and not text.isdigit():
+                    record["company_name"] = text
+                    logger.info(f"Found company name without URL: {text}")
+                    break
+            if record["company_name"]:
+                break
+
+    return record
+
+def parse_company_html(html):
+    """Evaluate the company website selectors against saved page HTML with lxml"""
+    import lxml.html
+
+    record = {"website": None, "domains": []}
+    doc = lxml.html.fromstring(html)
+    doc.make_links_absolute("https://www.linkedin.com")
+
+    for selector in COMPANY_WEBSITE_SELECTORS:
+        for website_link in doc.cssselect(selector):
+            website = website_link.get("href")
+            domain = _website_domain(website)
+            if domain:
+                logger.info(f"Found website {website}, extracted domain: {domain}")
+                record["website"] = record["website"] or website
+                record["domains"].append(domain)
+    return record
+
+@functools.lru_cache(maxsize=None)
+def _get_tld_extractor():
+    """Shared offline tldextract instance, built on first use"""
+    import tldextract
+    return tldextract.TLDExtract(cache_dir=TLDEXTRACT_CACHE_DIR, suffix_list_urls=(),
+                                 fallback_to_snapshot=True)
+
+@functools.lru_cache(maxsize=8192)
+def extract_domain_parts(text):
+    """Memoized tldextract split (subdomain, domain, suffix) of a host, URL or email domain"""
+    return _get_tld_extractor()(text)
+
+def registrable_domain(text):
+    """The "domain.suffix" part of a host or URL, or None when it has no known public suffix"""
+    if not text:
+        return None
+    ext = extract_domain_parts(text)
+    return f"{ext.domain}.{ext.suffix}" if ext.domain and ext.suffix else None
+
+def _website_domain(website):
+    """Registrable domain of a company website link, or None for LinkedIn/invalid links"""
+    if website and not "linkedin.com" in website.lower():
+        ext = extract_domain_parts(website)
+        # Make sure domain is valid
+        if ext.suffix and len(ext.domain) >= 2:
+            return f"{ext.domain}.{ext.suffix}"
+    return None
+
+def _scan_profile_page_live(driver):
+    """Evaluate the profile selector chains against the live browser"""
+    # name_from_link: the company name was read from the same link as company_url
+    record = {"headline": None, "company_name": None, "company_url": None, "name_from_link": False}
+
+    # Approach 0: First try to extract clean company name from headline or current position
+    for selector in PROFILE_HEADLINE_XPATHS:
         try:
-            driver.save_screenshot(f"profile_{profile_url.split('/in/')[1].split('/')[0]}.png")
+            elements = driver.find_elements(By.XPATH, selector)
+            if elements:
+                headline_text = elements[0].text.strip()
+                if headline_text:
+                    logger.info(f"Found headline text: {headline_text}")
+                    record["headline"] = headline_text
+                    break
         except Exception as e:
-            logger.warning(f"Failed to save profile screenshot: {str(e)}")
-        
-        company_url = None
-        company_name = None
-        domains = []
-        
-        # Approach 0: First try to extract clean company name from headline or current position
-        headline_selectors = [
-            "//div[contains(@class, 'pv-text-details__left-panel')]//h2",
-            "//div[contains(@class, 'ph5')]//h2",
-            "//div[contains(@class, 'profile-info')]//h2",
-            "//div[contains(@class, 'ph5')]//div[contains(@class, 'mt2')]/div",
-            "//div[contains(@class, 'mt2')]//span[contains(@class, 't-semibold')]"
-        ]
-        
-        headline_text = None
-        for selector in headline_selectors:
+            logger.debug(f"Failed to find headline with selector {selector}: {str(e)}")
+    record["company_name"] = _company_from_headline(record["headline"])
+
+    # Approach 1: Look for experience section with multiple selectors
+    for selector in PROFILE_EXPERIENCE_XPATHS:
+        try:
+            company_section = driver.find_element(By.XPATH, selector)
+            logger.info(f"Found experience section with selector: {selector}")
+
+            # Now look for company link within this section
+            for link_selector in PROFILE_COMPANY_LINK_XPATHS:
+                try:
+                    company_links = company_section.find_elements(By.XPATH, link_selector)
+                    if company_links:
+                        record["company_url"] = company_links[0].get_attribute("href")
+                        extracted_company_name = company_links[0].text.strip()
+                        if extracted_company_name:
+                            logger.info(f"Found company link: {record['company_url']}, name: {extracted_company_name}")
+                            record["company_name"] = extracted_company_name
+                            record["name_from_link"] = True
+                            break
+                except Exception as e:
+                    logger.debug(f"Failed to find company link with selector {link_selector}: {str(e)}")
+
+            if record["company_url"]:
+                break
+        except Exception as e:
+            logger.debug(f"Failed to find experience section with selector {selector}: {str(e)}")
+
+    # Approach 2: If we still don't have a company URL, try to find it directly in the page
+    if not record["company_url"]:
+        logger.info("Trying alternative company extraction approach")
+        try:
+            # Find all links on the page
+            all_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/company/']")
+            # Filter to only company links in the main content
+            for link in all_links:
+                href = link.get_attribute("href")
+                if href and "/company/" in href:
+                    record["company_url"] = href
+                    extracted_company_name = link.text.strip()
+                    if extracted_company_name:
+                        logger.info(f"Found company via direct link approach: {href}, name: {extracted_company_name}")
+                        if not record["company_name"]:  # Only update if we don't have a name yet
+                            record["company_name"] = extracted_company_name
+                        record["name_from_link"] = record["company_name"] == extracted_company_name
+                        break
+        except Exception as e:
+            logger.warning(f"Alternative company extraction failed: {str(e)}")
+
+    # If still no company URL, try to at least get company name
+    if not record["company_name"]:
+        logger.info("Searching for company name without URL")
+        for selector in PROFILE_COMPANY_NAME_XPATHS:
             try:
                 elements = driver.find_elements(By.XPATH, selector)
-                if elements:
-                    headline_text = elements[0].text.strip()
-                    if headline_text:
-                        logger.info(f"Found headline text: {headline_text}")
+                for element in elements:
+                    text = element.text.strip()
+                    if text and len(text) > 1 and not text.isdigit():
+                        record["company_name"] = text
+                        logger.info(f"Found company name without URL: {text}")
                         break
-            except Exception as e:
-                logger.debug(f"Failed to find headline with selector {selector}: {str(e)}")
-        
-        # Extract company name from headline
-        if headline_text:
-            # Look for common patterns in headlines
-            company_indicators = ["at ", "@ ", "with ", "for ", "- "]
-            for indicator in company_indicators:
-                if indicator in headline_text.lower():
-                    parts = headline_text.split(indicator, 1)
-                    if len(parts) > 1:
-                        # Get the part after the indicator
-                        potential_company = parts[1].strip()
-                        # Clean up any trailing text after the company name
-                        for separator in [" • ", " | ", " - ", " at ", ","]:
-                            if separator in potential_company:
-                                potential_company = potential_company.split(separator, 1)[0].strip()
-                        
-                        logger.info(f"Extracted potential company from headline: {potential_company}")
-                        if potential_company and len(potential_company) > 1:
-                            company_name = potential_company
-                            break
-        
-        # Try different approaches to find company information
-        
-        # Approach 1: Look for experience section with multiple selectors
-        experience_selectors = [
-            "//section[contains(@class, 'experience')]//li[contains(@class, 'experience-item')][1]",
-            "//section[contains(@id, 'experience-section')]//li[1]",
-            "//div[contains(@class, 'experience-section')]//li[1]",
-            "//section[@id='experience']//li[1]",
-            "//div[contains(@class, 'pvs-list')]//li[contains(@class, 'artdeco-list__item')][1]"  # New LinkedIn
-        ]
-        
-        for selector in experience_selectors:
-            try:
-                company_section = driver.find_element(By.XPATH, selector)
-                logger.info(f"Found experience section with selector: {selector}")
-                
-                # Now look for company link within this section
-                company_link_selectors = [
-                    ".//a[contains(@href, '/company/') or contains(@data-field, 'experience_company')]",
-                    ".//a[contains(@href, '/company/')]",
-                    ".//a[contains(@data-control-name, 'background_details_company')]",
-                    ".//a[contains(@class, 'optional-action-target-wrapper')]",
-                    ".//span[contains(@class, 'enterprise-profile')]/a"
-                ]
-                
-                for link_selector in company_link_selectors:
-                    try:
-                        company_links = company_section.find_elements(By.XPATH, link_selector)
-                        if company_links:
-                            company_url = company_links[0].get_attribute("href")
-                            extracted_company_name = company_links[0].text.strip()
-                            if extracted_company_name:
-                                logger.info(f"Found company link: {company_url}, name: {extracted_company_name}")
-                                company_name = extracted_company_name
-                                break
-                    except Exception as e:
-                        logger.debug(f"Failed to find company link with selector {link_selector}: {str(e)}")
-                
-                if company_url:
+                if record["company_name"]:
                     break
             except Exception as e:
-                logger.debug(f"Failed to find experience section with selector {selector}: {str(e)}")
-        
-        # Approach 2: If we still don't have a company URL, try to find it directly in the page
-        if not company_url:
-            logger.info("Trying alternative company extraction approach")
-            try:
-                # Find all links on the page
-                all_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/company/']")
-                # Filter to only company links in the main content
-                for link in all_links:
-                    href = link.get_attribute("href")
-                    if href and "/company/" in href:
-                        company_url = href
-                        extracted_company_name = link.text.strip()
-                        if extracted_company_name:
-                            logger.info(f"Found company via direct link approach: {company_url}, name: {extracted_company_name}")
-                            if not company_name:  # Only update if we don't have a name yet
-                                company_name = extracted_company_name
-                            break
-            except Exception as e:
-                logger.warning(f"Alternative company extraction failed: {str(e)}")
-        
-        # If still no company URL, try to at least get company name
-        if not company_name:
-            logger.info("Searching for company name without URL")
-            company_name_selectors = [
-                "//div[contains(@class, 'experience-item__subtitle')]",
-                "//span[contains(@class, 'experience-item-company')]",
-                "//span[contains(@class, 'pv-entity__secondary-title')]",
-                "//div[contains(@class, 'inline-show-more-text')]",
-                "//span[contains(@class, 'hoverable-link-text')]"
-            ]
-            
-            for selector in company_name_selectors:
-                try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    if elements:
-                        for element in elements:
-                            text = element.text.strip()
-                            if text and len(text) > 1 and not text.isdigit():
-                                company_name = text
-                                logger.info(f"Found company name without URL: {company_name}")
-                                break
-                    if company_name:
-                        break
-                except Exception as e:
-                    logger.debug(f"Failed to find company name with selector {selector}: {str(e)}")
-        
-        # Clean up the company name before using it
+                logger.debug(f"Failed to find company name with selector {selector}: {str(e)}")
+
+    return record
+
+def _scan_company_page_live(driver):
+    """Evaluate the company website selectors against the live browser"""
+    record = {"website": None, "domains": []}
+    for selector in COMPANY_WEBSITE_SELECTORS:
+        try:
+            website_links = driver.find_elements(By.CSS_SELECTOR, selector)
+            for website_link in website_links:
+                website = website_link.get_attribute("href")
+                domain = _website_domain(website)
+                if domain:
+                    logger.info(f"Found website {website}, extracted domain: {domain}")
+                    record["website"] = record["website"] or website
+                    record["domains"].append(domain)
+        except Exception as e:
+            logger.debug(f"Failed to find website with selector {selector}: {str(e)}")
+    return record
+
+def _use_html_parser(parser=None):
+    """Whether page scans should run on page_source with lxml instead of live lookups"""
+    parser = parser or PAGE_PARSER
+    if parser == "lxml" and not LXML_AVAILABLE:
+        logger.warning("lxml not available, using live Selenium selectors")
+        return False
+    return parser == "lxml"
+
+def scan_profile_page(driver, parser=None):
+    """Read headline, company name and company URL from the loaded profile page"""
+    if _use_html_parser(parser):
+        try:
+            return parse_profile_html(driver.page_source)
+        except Exception as e:
+            logger.warning(f"HTML parsing of profile page failed, using live selectors: {str(e)}")
+    return _scan_profile_page_live(driver)
+
+def scan_company_page(driver, parser=None):
+    """Read the website link from the loaded company page"""
+    if _use_html_parser(parser):
+        try:
+            return parse_company_html(driver.page_source)
+        except Exception as e:
+            logger.warning(f"HTML parsing of company page failed, using live selectors: {str(e)}")
+    return _scan_company_page_live(driver)
+
+def clean_company_name(company_name):
+    """Remove legal suffixes and LinkedIn noise from a company name"""
+    if not company_name:
+        return company_name
+
+    # Remove common suffixes and prefixes
+    for suffix in [' Inc', ' LLC', ' Ltd', ' Limited', ' Corp', ' Corporation', ' GmbH', ' Co', ' Pvt']:
+        if company_name.endswith(suffix):
+            company_name = company_name.rsplit(suffix, 1)[0].strip()
+
+    # Remove any non-company text like "full-time", "present", etc.
+    noise_terms = ['full-time', 'part-time', 'present', '·', 'fulltime', 'area', 'india',
+                  'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+                  '2023', '2022', '2021', '2020', '2019', '2018', '2017', '2016', '2015', '2014',
+                  '2013', '2012', '2011', '2010', 'connection', 'profile', 'view', 'degree',
+                  'chieftechnology', 'officer', 'cto', 'ceo', 'present', 'yrs', 'mos', 'to']
+
+    clean_name = company_name.lower()
+    # Extract words from company name
+    name_words = []
+    for word in clean_name.split():
+        word = ''.join(c for c in word if c.isalnum())  # Remove non-alphanumeric chars
+        if word and word not in noise_terms and len(word) > 1:
+            name_words.append(word)
+
+    # Reconstruct company name from clean words
+    if name_words:
+        clean_company_name = ' '.join(name_words)
+        logger.info(f"Cleaned company name: {clean_company_name}")
+        company_name = clean_company_name
+    return company_name
+
+# Default for guess_company_domains when the caller has not looked the company up yet
+_NOT_LOOKED_UP = object()
+
+def guess_company_domains(company_name, index_match=_NOT_LOOKED_UP):
+    """Guess candidate domains for a company name, most likely first
+
+    index_match is the caller's lookup_company_domain result, so the index is queried (and
+    its stats counted) once. A fuzzy match comes first and is only usable once it resolves.
+    """
+    logger.info(f"Trying to guess domain from company name: {company_name}")
+    # Clean company name and try common domain patterns
+    clean_name = company_name.lower()
+    # Remove any remaining non-alphanumeric characters
+    clean_name = ''.join(c for c in clean_name if c.isalnum() or c.isspace())
+    # Create a single word version (no spaces)
+    single_word = clean_name.replace(' ', '')
+
+    # Companies we already know (seeded or confirmed in earlier runs) need no guessing
+    match = lookup_company_domain(company_name) if index_match is _NOT_LOOKED_UP else index_match
+    if match:
+        domain, match_type = match
+        if match_type != "fuzzy":
+            return [domain]
+    
+    # Try some common domain patterns
+    potential_domains = [
+        f"{single_word}.com",
+        f"{single_word}.io",
+        f"{single_word}.co",
+        f"{single_word}.org",
+        f"{single_word}.net"
+    ]
+
+    # Try additional variations if name is multiple words
+    if ' ' in clean_name:
+        name_parts = clean_name.split()
+        if len(name_parts) >= 2:
+            # First letter of each word
+            acronym = ''.join(part[0] for part in name_parts)
+            potential_domains.append(f"{acronym}.com")
+
+            # First word only
+            potential_domains.append(f"{name_parts[0]}.com")
+
+            # First two words with hyphen
+            if len(name_parts) >= 2:
+                potential_domains.append(f"{name_parts[0]}-{name_parts[1]}.com")
+
+    # A fuzzy match goes first but only counts once it resolves (see domain_from_company_record)
+    if match:
+        potential_domains.insert(0, match[0])
+
+    logger.info(f"Guessing these potential domains: {potential_domains}")
+    return potential_domains
+
+_company_cache_stats = {"hits": 0, "misses": 0}
+
+COMPANY_LEGAL_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "gmbh", "co", "pvt"}
+
+def _company_cache_keys(company_url=None, company_name=None):
+    """Cache keys for a LinkedIn company URL (by slug) and a normalized company name"""
+    keys = []
+    if company_url and "/company/" in company_url:
+        slug = company_url.split("/company/")[1].split("?")[0].split("#")[0].split("/")[0].lower()
+        if slug:
+            keys.append(f"url:{slug}")
+    normalized_name = normalize_company_name(company_name)
+    if normalized_name:
+        keys.append(f"name:{normalized_name}")
+    return keys
+
+def normalize_company_name(company_name):
+    """Lowercase alphanumeric words of a company name without trailing legal suffixes"""
+    if not company_name:
+        return ""
+    words = ''.join(c for c in company_name.lower() if c.isalnum() or c.isspace()).split()
+    # Drop legal suffixes so "Acme Corp Inc" and "acme" share an entry
+    while len(words) > 1 and words[-1] in COMPANY_LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+def get_cached_company_domain(company_url=None, company_name=None, record_miss=True):
+    """Look up a previously resolved website domain by company URL, then by company name
+
+    With record_miss=False a miss is left for the caller to count, so a lookup that falls
+    through to another one is counted once.
+    """
+    keys = _company_cache_keys(company_url, company_name)
+    if not keys:
+        return None
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+            for key in keys:
+                row = db.execute(
+                    "SELECT domain FROM company_cache WHERE cache_key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+                if row:
+                    _company_cache_stats["hits"] += 1
+                    logger.info(f"Company cache hit for {key}: {row[0]}")
+                    return row[0]
+    except Exception as e:
+        logger.debug(f"Company cache read failed: {str(e)}")
+    if record_miss:
+        _company_cache_stats["misses"] += 1
+    return None
+
+def cache_company_domain(domain, company_url=None, company_name=None):
+    """Remember the website domain resolved for a company URL and name"""
+    keys = _company_cache_keys(company_url, company_name)
+    if not domain or not keys:
+        return
+    expires_at = time.time() + COMPANY_CACHE_TTL
+    try:
+        with _cache_db_lock:
+            get_cache_db().executemany(
+                "INSERT OR REPLACE INTO company_cache (cache_key, domain, expires_at) VALUES (?, ?, ?)",
+                [(key, domain, expires_at) for key in keys]
+            )
+    except Exception as e:
+        logger.debug(f"Company cache write failed: {str(e)}")
+    
+    # A domain confirmed on a company page or through Proxycurl also grows the name index
+    add_company_domain(company_name, domain, source="confirmed", company_url=company_url)
+
+def get_company_cache_stats():
+    """Hit/miss counters of the company domain cache for the debug info"""
+    return dict(_company_cache_stats)
+
+def reset_company_cache_stats():
+    """Reset the company cache counters (the cached domains are kept)"""
+    for key in _company_cache_stats:
+        _company_cache_stats[key] = 0
+
+_company_index_stats = {"exact": 0, "prefix": 0, "fuzzy": 0, "misses": 0}
+
+def _upsert_company_domains(db, rows):
+    """Insert or refresh (name, domain, source) rows; a repeated domain counts as another confirmation"""
+    db.executemany(
+        "INSERT INTO company_domains (name, domain, source, confirmations, updated_at) VALUES (?, ?, ?, 1, ?) "
+        "ON CONFLICT (name) DO UPDATE SET "
+        "confirmations = CASE WHEN company_domains.domain = excluded.domain "
+        "THEN company_domains.confirmations + 1 ELSE 1 END, "
+        "domain = excluded.domain, source = excluded.source, updated_at = excluded.updated_at",
+        rows
+    )
+
+def _seed_company_index(db):
+    """Add the built-in companies (and COMPANY_INDEX_FILE, if set) without overriding learned entries"""
+    now = time.time()
+    db.executemany(
+        "INSERT OR IGNORE INTO company_domains (name, domain, source, confirmations, updated_at) "
+        "VALUES (?, ?, 'seed', 1, ?)",
+        [(name, domain, now) for name, domain in COMPANY_DOMAIN_SEED.items()]
+    )
+    if COMPANY_INDEX_FILE and os.path.exists(COMPANY_INDEX_FILE):
+        load_company_index(COMPANY_INDEX_FILE, db=db)
+
+def load_company_index(path, db=None):
+    """Bulk-load "name,domain" lines (names and aliases) into the company index; returns the count"""
+    now = time.time()
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            name, _, domain = line.strip().rpartition(",")
+            name = normalize_company_name(name)
+            domain = domain.strip().lower()
+            if name and "." in domain:
+                rows.append((name, domain, "file", now))
+    with _cache_db_lock:
+        db = db or get_cache_db()
+        db.execute("BEGIN")
+        try:
+            _upsert_company_domains(db, rows)
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+    logger.info(f"Loaded {len(rows)} company names from {path}")
+    return len(rows)
+
+def add_company_domain(company_name, domain, source="confirmed", company_url=None):
+    """Remember a company's domain under its normalized name and its LinkedIn company slug"""
+    if not domain:
+        return
+    names = {normalize_company_name(company_name)}
+    if company_url and "/company/" in company_url:
+        slug = company_url.split("/company/")[1].split("?")[0].split("/")[0]
+        names.add(normalize_company_name(slug.replace("-", " ")))
+    now = time.time()
+    rows = [(name, domain.lower(), source, now) for name in names if name]
+    if not rows:
+        return
+    try:
+        with _cache_db_lock:
+            _upsert_company_domains(get_cache_db(), rows)
+    except Exception as e:
+        logger.debug(f"Company index write failed: {str(e)}")
+
+def lookup_company_domain(company_name):
+    """Find a company's domain in the name index; returns (domain, match type) or None
+
+    Tries the normalized name and its no-spaces form, then shorter leading-word prefixes of
+    at least two words ("acme robotics europe" -> "acme robotics"; a single word like "apple"
+    is too ambiguous), then a fuzzy match among names that share the first two characters.
+    """
+    name = normalize_company_name(company_name)
+    if not name:
+        return None
+    words = name.split()
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+
+            def exact(key):
+                row = db.execute("SELECT domain FROM company_domains WHERE name = ?", (key,)).fetchone()
+                return row[0] if row else None
+
+            for key in (name, name.replace(" ", "")):
+                domain = exact(key)
+                if domain:
+                    _company_index_stats["exact"] += 1
+                    return domain, "exact"
+
+            for length in range(len(words) - 1, 1, -1):
+                domain = exact(" ".join(words[:length]))
+                if domain:
+                    _company_index_stats["prefix"] += 1
+                    return domain, "prefix"
+
+            prefix = name[:2]
+            candidates = dict(db.execute(
+                "SELECT name, domain FROM company_domains WHERE name >= ? AND name < ? LIMIT 500",
+                (prefix, prefix + "\uffff")
+            ).fetchall())
+    except Exception as e:
+        logger.debug(f"Company index lookup failed for {company_name}: {str(e)}")
+        return None
+
+    close = difflib.get_close_matches(name, list(candidates), n=1, cutoff=COMPANY_FUZZY_CUTOFF)
+    if close:
+        _company_index_stats["fuzzy"] += 1
+        logger.info(f"Fuzzy company match: '{name}' -> '{close[0]}'")
+        return candidates[close[0]], "fuzzy"
+    _company_index_stats["misses"] += 1
+    return None
+
+def get_company_index_stats():
+    """Match counters of the company name index for the debug info"""
+    return dict(_company_index_stats)
+
+def reset_company_index_stats():
+    """Reset the company index counters (the index itself is kept)"""
+    for key in _company_index_stats:
+        _company_index_stats[key] = 0
+
+def extract_company_record(driver, profile_url, parser=None):
+    """Visit a profile (and its company page) and return headline, company name, company URL and website"""
+    logger.info(f"Extracting company domain from profile: {profile_url}")
+    navigate(driver, profile_url, "profile")
+
+    # Take screenshot for debugging
+    capture_screenshot(driver, f"profile_{profile_url.split('/in/')[1].split('/')[0]}")
+
+    record = scan_profile_page(driver, parser)
+    record["company_name"] = clean_company_name(record["company_name"])
+    record["website"] = None
+    record["domains"] = []
+
+    # Skip the company page entirely if we already resolved this company
+    cached_domain = get_cached_company_domain(record["company_url"], record["company_name"])
+    if cached_domain:
+        record["domains"] = [cached_domain]
+        return record
+
+    # If we have a company URL, visit it to get the website; the name is only cached along
+    # with the domain when it was read from that same company link
+    if record["company_url"]:
+        linked_name = record["company_name"] if record["name_from_link"] else None
+        company_record = visit_company_page(driver, record["company_url"], linked_name, parser)
+        record["website"] = company_record["website"]
+        record["domains"] = company_record["domains"]
+
+    return record
+
+@timed_stage("company_navigation")
+def visit_company_page(driver, company_url, company_name=None, parser=None):
+    """Open a company page, read its website link and cache the resolved domain"""
+    logger.info(f"Visiting company page: {company_url}")
+    navigate(driver, company_url, "company")
+
+    company_record = scan_company_page(driver, parser)
+    if company_record["domains"]:
+        cache_company_domain(company_record["domains"][0], company_url, company_name)
+
+    # Take screenshot of company page for debugging
+    capture_screenshot(driver, "company_page")
+
+    return company_record
+
+def resolve_domain_from_search_data(driver, search_data, parser=None):
+    """Resolve a company domain from what the search card showed, without opening the profile
+
+    Returns None when the card data isn't enough, so the caller can fall back to the profile page.
+    A name split out of the headline only counts through an exact/prefix index or cache hit:
+    guessing from it would skip the experience section, which names the company reliably.
+    """
+    company_url = search_data.company_url
+    company_name = clean_company_name(search_data.company_name)
+    if not company_url and not company_name:
+        return None
+
+    # On a miss that falls back to the profile page, extract_company_record counts the lookup
+    cached_domain = get_cached_company_domain(company_url, company_name, record_miss=False)
+    if cached_domain:
+        return clean_text_data(cached_domain, is_domain=True)
+
+    domain = None
+    # A company already in the name index needs no company page visit
+    match = lookup_company_domain(company_name) if company_name else None
+    if match and match[1] != "fuzzy":
+        domain = match[0]
+
+    if not domain and company_url and driver:
+        linked_name = company_name if search_data.company_source == "link" else None
+        company_record = visit_company_page(driver, company_url, linked_name, parser)
+        if company_record["domains"]:
+            domain = company_record["domains"][0]
+
+    if not domain and company_name and search_data.company_source in ("link", "summary"):
+        guesses = guess_company_domains(company_name, match)
+        # A single guess is a known company; otherwise only trust a guess that resolves
+        domain = guesses[0] if len(guesses) == 1 else first_resolving_domain(guesses)
+
+    if not domain:
+        return None
+    _company_cache_stats["misses"] += 1
+    return clean_text_data(domain, is_domain=True)
+
+def domain_from_company_record(record, profile_url=None):
+    """Pick the company domain for a record, guessing from the company name if needed"""
+    domains = list(record.get("domains") or [])
+    company_name = record.get("company_name")
+
+    # If we have a company name but no domain yet, try to guess the domain
+    if company_name and not domains:
+        match = lookup_company_domain(company_name)
+        guesses = guess_company_domains(company_name, match)
+        if len(guesses) > 1:
+            # Check all guesses concurrently and prefer the best-ranked one that resolves
+            verified = first_resolving_domain(guesses)
+            if verified:
+                logger.info(f"Verified guessed domain via DNS: {verified}")
+                guesses = [verified]
+            elif match and match[1] == "fuzzy":
+                # An unverified fuzzy match (always first) never becomes the fallback domain
+                guesses = guesses[1:]
+        domains.extend(guesses)
+
+    # Return the first domain we found or first potential domain
+    if domains:
+        # Clean the domain to ensure it's properly formatted
+        cleaned_domain = clean_text_data(domains[0], is_domain=True)
+        return cleaned_domain
+    else:
+        # If no domain found, use a placeholder based on company name if available
         if company_name:
-            # Remove common suffixes and prefixes
-            for suffix in [' Inc', ' LLC', ' Ltd', ' Limited', ' Corp', ' Corporation', ' GmbH', ' Co', ' Pvt']:
-                if company_name.endswith(suffix):
-                    company_name = company_name.rsplit(suffix, 1)[0].strip()
-            
-            # Remove any non-company text like "full-time", "present", etc.
-            noise_terms = ['full-time', 'part-time', 'present', '·', 'fulltime', 'area', 'india', 
-                          'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
-                          '2023', '2022', '2021', '2020', '2019', '2018', '2017', '2016', '2015', '2014',
-                          '2013', '2012', '2011', '2010', 'connection', 'profile', 'view', 'degree', 
-                          'chieftechnology', 'officer', 'cto', 'ceo', 'present', 'yrs', 'mos', 'to']
-            
-            clean_name = company_name.lower()
-            # Extract words from company name
-            name_words = []
-            for word in clean_name.split():
-                word = ''.join(c for c in word if c.isalnum())  # Remove non-alphanumeric chars
-                if word and word not in noise_terms and len(word) > 1:
-                    name_words.append(word)
-            
-            # Reconstruct company name from clean words
-            if name_words:
-                clean_company_name = ' '.join(name_words)
-                logger.info(f"Cleaned company name: {clean_company_name}")
-                company_name = clean_company_name
-        
-        # If we have a company URL, visit it to get the website
-        if company_url:
-            logger.info(f"Visiting company page: {company_url}")
-            driver.get(company_url)
-            time.sleep(5)
-            
-            # Try to find company website link
-            website_selectors = [
-                "a[data-control-name='website']",
-                "a[data-control-name='org_about_module_website_link']",
-                "a[data-test-about-company-website-link]",
-                "a[href*='http']:not([href*='linkedin.com'])"
-            ]
-            
-            for selector in website_selectors:
-                try:
-                    website_links = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for website_link in website_links:
-                        website = website_link.get_attribute("href")
-                        if website and not "linkedin.com" in website.lower():
-                            ext = tldextract.extract(website)
-                            domain = f"{ext.domain}.{ext.suffix}"
-                            # Make sure domain is valid
-                            if ext.suffix and len(ext.domain) >= 2:
-                                logger.info(f"Found website {website}, extracted domain: {domain}")
-                                domains.append(domain)
-                except Exception as e:
-                    logger.debug(f"Failed to find website with selector {selector}: {str(e)}")
-            
-            # Take screenshot of company page for debugging
-            try:
-                driver.save_screenshot(f"company_page.png")
-            except Exception:
-                pass
-        
-        # If we have a company name but no domain yet, try to guess the domain
-        if company_name and not domains:
-            logger.info(f"Trying to guess domain from company name: {company_name}")
-            # Clean company name and try common domain patterns
-            clean_name = company_name.lower()
-            # Remove any remaining non-alphanumeric characters
-            clean_name = ''.join(c for c in clean_name if c.isalnum() or c.isspace())
-            # Create a single word version (no spaces)
-            single_word = clean_name.replace(' ', '')
-            
-            # Check for company names that are actually common known domains
-            known_companies = {
-                'google': 'google.com',
-                'microsoft': 'microsoft.com',
-                'apple': 'apple.com',
-                'amazon': 'amazon.com',
-                'facebook': 'facebook.com',
-                'meta': 'meta.com',
-                'netflix': 'netflix.com',
-                'uber': 'uber.com',
-                'linkedin': 'linkedin.com',
-                'twitter': 'twitter.com',
-                'tesla': 'tesla.com',
-                'intel': 'intel.com',
-                'amd': 'amd.com',
-                'nvidia': 'nvidia.com',
-                'ibm': 'ibm.com',
-                'oracle': 'oracle.com',
-                'salesforce': 'salesforce.com',
-                'paypal': 'paypal.com',
-                'adobe': 'adobe.com',
-                'cisco': 'cisco.com',
-                'ethereum': 'ethereum.org',
-                'bitcoin': 'bitcoin.org',
-                'perforce': 'perforce.com'
-            }
-            
-            # Check if the company name or single word version is a known company
-            if clean_name in known_companies:
-                domains.append(known_companies[clean_name])
-            elif single_word in known_companies:
-                domains.append(known_companies[single_word])
-            else:
-                # Try some common domain patterns
-                potential_domains = [
-                    f"{single_word}.com",
-                    f"{single_word}.io",
-                    f"{single_word}.co",
-                    f"{single_word}.org",
-                    f"{single_word}.net"
-                ]
-                
-                # Try additional variations if name is multiple words
-                if ' ' in clean_name:
-                    name_parts = clean_name.split()
-                    if len(name_parts) >= 2:
-                        # First letter of each word
-                        acronym = ''.join(part[0] for part in name_parts)
-                        potential_domains.append(f"{acronym}.com")
-                        
-                        # First word only
-                        potential_domains.append(f"{name_parts[0]}.com")
-                        
-                        # First two words with hyphen
-                        if len(name_parts) >= 2:
-                            potential_domains.append(f"{name_parts[0]}-{name_parts[1]}.com")
-                    
-                logger.info(f"Guessing these potential domains: {potential_domains}")
-                domains.extend(potential_domains)
-        
-        # Return the first domain we found or first potential domain
-        if domains:
-            # Clean the domain to ensure it's properly formatted
-            cleaned_domain = clean_text_data(domains[0], is_domain=True)
-            return cleaned_domain
+            # Try to create a domain from the company name
+            clean_name = ''.join(c for c in company_name.lower() if c.isalnum() or c.isspace())
+            domain = clean_name.replace(' ', '') + '.com'
+            logger.warning(f"No domain found, using placeholder: {domain}")
+            return domain
         else:
-            # If no domain found, use a placeholder based on company name if available
-            if company_name:
-                # Try to create a domain from the company name
-                clean_name = ''.join(c for c in company_name.lower() if c.isalnum() or c.isspace())
-                domain = clean_name.replace(' ', '') + '.com'
-                logger.warning(f"No domain found, using placeholder: {domain}")
-                return domain
-            else:
-                logger.warning(f"No company domain found for profile: {profile_url}")
-                return "example.com"  # Default fallback domain
+            logger.warning(f"No company domain found for profile: {profile_url}")
+            return "example.com"  # Default fallback domain
+
+@timed_stage("profile_navigation")
+def extract_company_domain(driver, profile_url, parser=None):
+    """Extract company domain from profile with enhanced extraction"""
+    try:
+        record = extract_company_record(driver, profile_url, parser)
+        return domain_from_company_record(record, profile_url)
     except Exception as e:
         logger.error(f"Error extracting company domain: {str(e)}")
         return "example.com"  # Default fallback domain
 
+@timed_stage("pattern_generation")
 def get_valid_email(first, last, domain):
     """Generate and validate email patterns with extended patterns and better validation"""
     if not domain:
@@ -1260,7 +2694,7 @@ def get_valid_email(first, last, domain):
         
     # Validate domain format first
     try:
-        ext = tldextract.extract(domain)
+        ext = extract_domain_parts(domain)
         if not ext.domain or not ext.suffix or len(ext.domain) < 2:
             logger.warning(f"Invalid domain format: {domain}")
             return None
@@ -1325,7 +2759,7 @@ def get_valid_email(first, last, domain):
                     # Note: actual SMTP verification can trigger spam detection,
                     # so we just check if the domain has MX records
                     domain_part = email.split('@')[1]
-                    if validate_email(email, check_mx=True, verify=False):
+                    if email_passes_mx_check(email):
                         logger.info(f"Found valid email: {email}")
                         return email
                 except Exception as e:
@@ -1343,7 +2777,7 @@ def get_valid_email(first, last, domain):
     for email in generic_patterns:
         try:
             logger.info(f"Trying generic email: {email}")
-            if validate_email(email, check_mx=True, verify=False):
+            if email_passes_mx_check(email):
                 logger.info(f"Found valid generic email: {email}")
                 return email
             elif "@" in email and "." in email.split("@")[1]:
@@ -1362,6 +2796,210 @@ def get_valid_email(first, last, domain):
     logger.warning(f"No valid email found, using fallback: {fallback_email}")
     return fallback_email
 
+def _email_name_parts(first_name, last_name):
+    """Lowercase alphanumeric first/last name as used in email local parts"""
+    first = ''.join(c for c in (first_name or "").lower() if c.isalnum())
+    last = ''.join(c for c in (last_name or "").lower() if c.isalnum())
+    return first, last
+
+def build_email(email_format, first_name, last_name, domain):
+    """Build an address in a known format, or None if the name doesn't fit it"""
+    first, last = _email_name_parts(first_name, last_name)
+    builder = EMAIL_FORMATS.get(email_format)
+    if not builder or not first or (not last and email_format != "first"):
+        return None
+    return f"{builder(first, last)}@{domain}"
+
+def infer_email_format(email, first_name, last_name):
+    """Work out which EMAIL_FORMATS entry produced a confirmed address"""
+    if not email or "@" not in email:
+        return None
+    local_part = email.split("@")[0].lower()
+    first, last = _email_name_parts(first_name, last_name)
+    if not first:
+        return None
+    for email_format, builder in EMAIL_FORMATS.items():
+        if not last and email_format != "first":
+            continue
+        if builder(first, last) == local_part:
+            return email_format
+    return None
+
+def record_email_format(email, first_name, last_name):
+    """Add a confirmed address to the per-domain email format index"""
+    email_format = infer_email_format(email, first_name, last_name)
+    if not email_format:
+        return None
+    domain = email.split("@")[1].lower()
+    try:
+        with _cache_db_lock:
+            get_cache_db().execute(
+                "INSERT INTO email_formats (domain, format, hits, updated_at) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(domain, format) DO UPDATE SET hits = hits + 1, updated_at = excluded.updated_at",
+                (domain, email_format, time.time())
+            )
+        logger.info(f"Learned email format {email_format} for {domain}")
+    except Exception as e:
+        logger.debug(f"Failed to record email format for {domain}: {str(e)}")
+    return email_format
+
+def get_learned_email_format(domain):
+    """Most frequently confirmed email format for a domain, or None"""
+    if not domain:
+        return None
+    try:
+        with _cache_db_lock:
+            row = get_cache_db().execute(
+                "SELECT format FROM email_formats WHERE domain = ? ORDER BY hits DESC, updated_at DESC LIMIT 1",
+                (domain.lower(),)
+            ).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.debug(f"Failed to read email format for {domain}: {str(e)}")
+        return None
+
+class HostRateLimiter:
+    """Token bucket for one API host, refilled at `rate` per second and synced to X-RateLimit headers"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request to this host is allowed"""
+        if not self.rate or self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def update_from_headers(self, headers):
+        """Pause the bucket when the server says we're out of quota"""
+        now = time.monotonic()
+        pause = 0.0
+        try:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None and int(remaining) <= 0 and reset is not None:
+                reset = float(reset)
+                # GitHub sends an epoch timestamp, others seconds until reset
+                pause = reset - time.time() if reset > 1e9 else reset
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                pause = max(pause, float(retry_after))
+        except (TypeError, ValueError):
+            return
+        if pause > 0:
+            with self.lock:
+                self.blocked_until = max(self.blocked_until, now + pause)
+                self.tokens = 0
+            logger.warning(f"Rate limit reached, pausing requests to this host for {pause:.0f}s")
+
+_http_lock = threading.Lock()
+_http_sessions = {}
+_http_limiters = {}
+_http_stats = {}
+
+def get_http_session(host):
+    """Keep-alive session for one API host, created on first use"""
+    with _http_lock:
+        if host not in _http_sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_sessions[host] = session
+            _http_limiters[host] = HostRateLimiter(HTTP_HOST_RATES.get(host, HTTP_DEFAULT_RATE))
+        return _http_sessions[host]
+
+def _host_stats(host):
+    """The stats entry for host, created if missing (callers hold _http_lock)"""
+    return _http_stats.setdefault(host, {"latencies": [], "errors": 0, "retries": 0, "statuses": {}})
+
+def _record_http(host, seconds, status=None, error=None):
+    with _http_lock:
+        stats = _host_stats(host)
+        stats["latencies"].append(seconds)
+        if error is not None or (status is not None and status >= 400):
+            stats["errors"] += 1
+        key = str(status) if status is not None else type(error).__name__
+        stats["statuses"][key] = stats["statuses"].get(key, 0) + 1
+
+def http_request(method, url, timeout=None, max_attempts=None, **kwargs):
+    """Send a request through the host's pooled session, rate limiter and retry policy
+
+    Connection errors and timeouts are retried with backoff and re-raised once attempts run out;
+    429/5xx responses are retried too, and the last one is returned to the caller.
+    """
+    host = urlparse(url).netloc
+    session = get_http_session(host)
+    limiter = _http_limiters[host]
+
+    def attempt():
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = session.request(method, url, timeout=timeout or HTTP_TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            _record_http(host, time.perf_counter() - started, error=e)
+            raise
+        _record_http(host, time.perf_counter() - started, status=response.status_code)
+        limiter.update_from_headers(response.headers)
+        return response
+
+    def before_retry(retry_state):
+        with _http_lock:
+            # A reset between the failed attempt and this callback would have dropped the host's entry
+            _host_stats(host)["retries"] += 1
+        outcome = retry_state.outcome
+        reason = outcome.exception() if outcome.failed else f"HTTP {outcome.result().status_code}"
+        logger.warning(f"Retrying {method} {host} after {reason} (attempt {retry_state.attempt_number})")
+
+    retrying = Retrying(
+        stop=stop_after_attempt(max_attempts or HTTP_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        retry=(retry_if_exception_type((requests.ConnectionError, requests.Timeout))
+               | retry_if_result(lambda response: response.status_code in HTTP_RETRY_STATUSES)),
+        before_sleep=before_retry,
+        retry_error_callback=lambda retry_state: retry_state.outcome.result()
+    )
+    return retrying(attempt)
+
+def get_http_stats():
+    """Per-host request count, error and retry counts, status breakdown and latency percentiles"""
+    with _http_lock:
+        snapshot = {host: dict(stats, latencies=sorted(stats["latencies"]), statuses=dict(stats["statuses"]))
+                    for host, stats in _http_stats.items()}
+    metrics = {}
+    for host, stats in snapshot.items():
+        latencies = stats["latencies"]
+        metrics[host] = {
+            "requests": len(latencies),
+            "errors": stats["errors"],
+            "retries": stats["retries"],
+            "statuses": stats["statuses"],
+            "p50_ms": round(_percentile(latencies, 0.50) * 1000, 1) if latencies else None,
+            "p95_ms": round(_percentile(latencies, 0.95) * 1000, 1) if latencies else None
+        }
+    return metrics
+
+def reset_http_stats():
+    """Clear the per-host HTTP metrics (sessions and rate limiters are kept)"""
+    with _http_lock:
+        _http_stats.clear()
+
+@timed_stage("apollo")
 def fetch_email_from_apollo(profile_url, first_name=None, last_name=None, company_domain=None):
     """Use Apollo.io API to fetch email for a LinkedIn profile"""
     if not APOLLO_API_KEY:
@@ -1373,8 +3011,9 @@ def fetch_email_from_apollo(profile_url, first_name=None, last_name=None, compan
     try:
         # Extract LinkedIn ID from URL
         linkedin_id = None
-        if '/in/' in profile_url:
-            linkedin_id = profile_url.split('/in/')[1].split('/')[0].split('?')[0]
+        canonical_url = canonical_profile_url(profile_url)
+        if canonical_url:
+            linkedin_id = canonical_url.split('/in/')[1]
         
         if not linkedin_id:
             logger.warning("Could not extract LinkedIn ID from URL")
@@ -1401,51 +3040,64 @@ def fetch_email_from_apollo(profile_url, first_name=None, last_name=None, compan
         if company_domain:
             payload["domain"] = company_domain
         
-        logger.info(f"Sending request to Apollo API: {json.dumps(payload, default=str)}")
+        # Reuse a cached match for this profile and domain if we have one
+        cache_key = f"{normalize_linkedin_url(profile_url)}|{(company_domain or '').lower()}"
+        cached, data = api_cache_get("apollo_match", cache_key)
         
-        # Make the API call
-        response = requests.post(api_url, json=payload)
-        
-        if response.status_code == 200:
+        if not cached:
+            logger.info(f"Sending request to Apollo API: {json.dumps(payload, default=str)}")
+            
+            # Make the API call
+            response = http_request("POST", api_url, json=payload)
+            
+            if response.status_code != 200:
+                logger.error(f"Apollo API error: {response.status_code} - {response.text}")
+                return None
+            
             data = response.json()
-            logger.info(f"Apollo API response: {json.dumps(data, default=str)}")
+            # Responses without a person are cached as misses
+            api_cache_put("apollo_match", cache_key, data if data and data.get("person") else None)
+        
+        logger.info(f"Apollo API response: {json.dumps(data, default=str)}")
+        
+        # Check if person data exists
+        if data and "person" in data and data["person"]:
+            person = data["person"]
             
-            # Check if person data exists
-            if data and "person" in data and data["person"]:
-                person = data["person"]
-                
-                # Check for email
-                if "email" in person and person["email"]:
-                    logger.info(f"Found email via Apollo: {person['email']}")
-                    return person["email"]
-                
-                # Try work email if available
-                if "work_email" in person and person["work_email"]:
-                    logger.info(f"Found work email via Apollo: {person['work_email']}")
-                    return person["work_email"]
-                
-                # Try personal email if available and allowed
-                if "personal_email" in person and person["personal_email"]:
-                    logger.info(f"Found personal email via Apollo: {person['personal_email']}")
-                    return person["personal_email"]
-                
-                # Try normalized email fields
-                email_fields = ["organization_email", "email_status", "emailer_campaign_emailer"]
-                for field in email_fields:
-                    if field in person and person[field]:
-                        logger.info(f"Found email via Apollo field {field}: {person[field]}")
-                        return person[field]
+            # Check for email
+            if "email" in person and person["email"]:
+                logger.info(f"Found email via Apollo: {person['email']}")
+                record_email_format(person["email"], person.get("first_name") or first_name,
+                                    person.get("last_name") or last_name)
+                return person["email"]
             
-            logger.warning("No email found in Apollo response")
-            return None
-        else:
-            logger.error(f"Apollo API error: {response.status_code} - {response.text}")
-            return None
+            # Try work email if available
+            if "work_email" in person and person["work_email"]:
+                logger.info(f"Found work email via Apollo: {person['work_email']}")
+                record_email_format(person["work_email"], person.get("first_name") or first_name,
+                                    person.get("last_name") or last_name)
+                return person["work_email"]
+            
+            # Try personal email if available and allowed
+            if "personal_email" in person and person["personal_email"]:
+                logger.info(f"Found personal email via Apollo: {person['personal_email']}")
+                return person["personal_email"]
+            
+            # Try normalized email fields
+            email_fields = ["organization_email", "email_status", "emailer_campaign_emailer"]
+            for field in email_fields:
+                if field in person and person[field]:
+                    logger.info(f"Found email via Apollo field {field}: {person[field]}")
+                    return person[field]
+        
+        logger.warning("No email found in Apollo response")
+        return None
             
     except Exception as e:
         logger.error(f"Error fetching email from Apollo: {str(e)}")
         return None
 
+@timed_stage("email_free")
 def fetch_email_free(profile_url, first_name=None, last_name=None, company_domain=None):
     """Use free methods to find an email for a LinkedIn profile without paid APIs"""
     logger.info(f"Attempting to find email for profile: {profile_url} using free methods")
@@ -1460,12 +3112,23 @@ def fetch_email_free(profile_url, first_name=None, last_name=None, company_domai
         "confidence": 0
     }
     
+    # Method 0: Use the format already confirmed for colleagues at this domain
+    learned_format = get_learned_email_format(company_domain)
+    if learned_format:
+        email = build_email(learned_format, first_name, last_name, company_domain)
+        if email:
+            email_data["email"] = email
+            email_data["source"] = "learned_format"
+            email_data["confidence"] = 0.85
+            logger.info(f"Using learned {learned_format} format for {company_domain}: {email}")
+            return email_data
+    
     # Method 1: DNS-based email verification for common patterns
     logger.info(f"Trying DNS-based email verification for {first_name} at {company_domain}")
     email_patterns = generate_email_patterns(first_name, last_name, company_domain)
     
-    for pattern in email_patterns:
-        if verify_email_exists_dns(pattern):
+    for pattern, exists in zip(email_patterns, verify_emails_dns_batch(email_patterns)):
+        if exists:
             email_data["email"] = pattern
             email_data["source"] = "dns_verification"
             email_data["confidence"] = 0.8
@@ -1489,6 +3152,7 @@ def fetch_email_free(profile_url, first_name=None, last_name=None, company_domai
         logger.info(f"Trying to find email from GitHub for {first_name} {last_name}")
         github_email = find_email_from_github(f"{first_name} {last_name}")
         if github_email and company_domain in github_email:
+            record_email_format(github_email, first_name, last_name)
             email_data["email"] = github_email
             email_data["source"] = "github"
             email_data["confidence"] = 0.7
@@ -1531,32 +3195,291 @@ def generate_email_patterns(first_name, last_name, domain):
     
     return patterns
 
-def verify_email_exists_dns(email):
-    """Verify if an email might exist by checking MX records"""
+# Domain -> (verdict, expires_at), backed by the dns_cache table
+_dns_cache = {}
+_dns_cache_stats = {"hits": 0, "misses": 0, "lookups": 0, "errors": 0}
+
+def _configure_resolver(resolver, nameservers=None, port=None, timeout=None):
+    """Apply the configured nameservers, port and timeout to a dnspython resolver"""
+    nameservers = nameservers or DNS_NAMESERVERS
+    if nameservers:
+        resolver.nameservers = list(nameservers)
+    resolver.port = port or DNS_PORT
+    if timeout:
+        resolver.timeout = timeout
+        resolver.lifetime = timeout
+    return resolver
+
+_dns_resolver = None
+
+def _get_dns_resolver():
+    """Shared blocking resolver honouring DNS_NAMESERVERS/DNS_PORT"""
+    global _dns_resolver
+    if _dns_resolver is None:
+        import dns.resolver
+        _dns_resolver = _configure_resolver(dns.resolver.Resolver(configure=not DNS_NAMESERVERS))
+    return _dns_resolver
+
+@timed_stage("dns_lookup")
+def _lookup_mail_records(domain):
+    """Resolve MX (then A) records for a domain and return (verdict, ttl); ttl is None for transient errors"""
+    import dns.resolver
+
+    resolver = _get_dns_resolver()
     try:
-        domain = email.split('@')[1]
         # Try to get MX records for the domain
+        mx_records = resolver.resolve(domain, 'MX')
+        # If we found MX records, the domain can receive emails
+        return bool(mx_records), max(mx_records.rrset.ttl, DNS_MIN_TTL)
+    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
+        # No MX records, try A records as fallback
+        try:
+            a_records = resolver.resolve(domain, 'A')
+            return bool(a_records), max(a_records.rrset.ttl, DNS_MIN_TTL)
+        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
+            return False, DNS_NEGATIVE_TTL
+        except Exception as e:
+            logger.debug(f"A lookup error for {domain}: {str(e)}")
+            return False, None
+    except Exception as e:
+        logger.debug(f"MX lookup error for {domain}: {str(e)}")
+        return False, None
+
+def _get_cached_dns_verdict(domain):
+    """Return the cached verdict for a domain, or None if missing or expired"""
+    now = time.time()
+    cached = _dns_cache.get(domain)
+    if cached is None:
         try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            # If we found MX records, the domain can receive emails
-            return True if mx_records else False
+            with _cache_db_lock:
+                row = get_cache_db().execute(
+                    "SELECT verdict, expires_at FROM dns_cache WHERE domain = ?", (domain,)
+                ).fetchone()
+            if row:
+                cached = (bool(row[0]), row[1])
+                _dns_cache[domain] = cached
+        except Exception as e:
+            logger.debug(f"DNS cache read failed for {domain}: {str(e)}")
+    if cached and cached[1] > now:
+        return cached[0]
+    return None
+
+def _store_dns_verdict(domain, verdict, ttl):
+    """Remember a verdict in memory and on disk until its TTL runs out"""
+    expires_at = time.time() + ttl
+    _dns_cache[domain] = (verdict, expires_at)
+    try:
+        with _cache_db_lock:
+            get_cache_db().execute(
+                "INSERT OR REPLACE INTO dns_cache (domain, verdict, expires_at) VALUES (?, ?, ?)",
+                (domain, int(verdict), expires_at)
+            )
+    except Exception as e:
+        logger.debug(f"DNS cache write failed for {domain}: {str(e)}")
+
+def domain_accepts_mail(domain):
+    """Check if a domain has MX (or A) records, using the persistent TTL-aware verdict cache"""
+    if not domain:
+        return False
+    domain = domain.strip().lower().rstrip(".")
+
+    verdict = _get_cached_dns_verdict(domain)
+    if verdict is not None:
+        _dns_cache_stats["hits"] += 1
+        return verdict
+
+    _dns_cache_stats["misses"] += 1
+    _dns_cache_stats["lookups"] += 1
+    verdict, ttl = _lookup_mail_records(domain)
+    if ttl is None:
+        # Timeouts and resolver failures are not cached
+        _dns_cache_stats["errors"] += 1
+    else:
+        _store_dns_verdict(domain, verdict, ttl)
+    return verdict
+
+async def _lookup_mail_records_async(resolver, domain):
+    """Async version of _lookup_mail_records on a dnspython async resolver"""
+    import dns.resolver
+
+    try:
+        mx_records = await resolver.resolve(domain, 'MX')
+        return bool(mx_records), max(mx_records.rrset.ttl, DNS_MIN_TTL)
+    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
+        try:
+            a_records = await resolver.resolve(domain, 'A')
+            return bool(a_records), max(a_records.rrset.ttl, DNS_MIN_TTL)
         except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
-            # No MX records, try A records as fallback
+            return False, DNS_NEGATIVE_TTL
+        except Exception as e:
+            logger.debug(f"Async A lookup error for {domain}: {str(e)}")
+            return False, None
+    except Exception as e:
+        logger.debug(f"Async MX lookup error for {domain}: {str(e)}")
+        return False, None
+
+@timed_stage("dns_batch")
+async def check_domains_async(domains, max_in_flight=None, timeout=None, nameservers=None, port=None,
+                              stop_at_first=False):
+    """Check which domains accept mail, resolving cache misses concurrently
+
+    Returns {domain: verdict}. With stop_at_first, outstanding queries are cancelled as soon
+    as the highest-ranked resolving domain is known (domains are in ranked order).
+    """
+    ranked = []
+    for domain in domains:
+        domain = (domain or "").strip().lower().rstrip(".")
+        if domain and domain not in ranked:
+            ranked.append(domain)
+
+    results = {}
+    pending = []
+    for domain in ranked:
+        verdict = _get_cached_dns_verdict(domain)
+        if verdict is None:
+            pending.append(domain)
+        else:
+            _dns_cache_stats["hits"] += 1
+            results[domain] = verdict
+
+    def first_decided():
+        # The winner is known once every domain ranked above it has a verdict
+        for domain in ranked:
+            if domain not in results:
+                return None
+            if results[domain]:
+                return domain
+        return None
+
+    if not pending or (stop_at_first and first_decided()):
+        return results
+
+    import dns.asyncresolver
+
+    timeout = timeout or DNS_QUERY_TIMEOUT
+    resolver = _configure_resolver(dns.asyncresolver.Resolver(configure=not (nameservers or DNS_NAMESERVERS)),
+                                   nameservers, port, timeout)
+    semaphore = asyncio.Semaphore(max_in_flight or DNS_MAX_IN_FLIGHT)
+
+    async def check(domain):
+        async with semaphore:
+            _dns_cache_stats["misses"] += 1
+            _dns_cache_stats["lookups"] += 1
             try:
-                a_records = dns.resolver.resolve(domain, 'A')
-                return True if a_records else False
-            except:
-                return False
+                verdict, ttl = await asyncio.wait_for(_lookup_mail_records_async(resolver, domain), timeout * 2)
+            except asyncio.TimeoutError:
+                verdict, ttl = False, None
+            if ttl is None:
+                _dns_cache_stats["errors"] += 1
+            else:
+                _store_dns_verdict(domain, verdict, ttl)
+            return domain, verdict
+
+    tasks = [asyncio.ensure_future(check(domain)) for domain in pending]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            domain, verdict = await next_done
+            results[domain] = verdict
+            if stop_at_first and first_decided():
+                break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+_async_loop = None
+_async_loop_thread = None
+_async_loop_lock = threading.Lock()
+
+def get_async_loop():
+    """Start (once) the long-lived event loop that all async work runs on"""
+    global _async_loop, _async_loop_thread
+    with _async_loop_lock:
+        if _async_loop is None or _async_loop.is_closed():
+            _async_loop = asyncio.new_event_loop()
+            _async_loop_thread = threading.Thread(target=_async_loop.run_forever,
+                                                  name="async-loop", daemon=True)
+            _async_loop_thread.start()
+        return _async_loop
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared event loop from synchronous code"""
+    loop = get_async_loop()
+    if threading.current_thread() is _async_loop_thread:
+        # Called from code already running on the shared loop: use a throwaway loop instead
+        result = {}
+        def runner():
+            result["value"] = asyncio.run(coro)
+        thread = threading.Thread(target=runner)
+        thread.start()
+        thread.join()
+        return result.get("value")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+def first_resolving_domain(candidates, **kwargs):
+    """Return the highest-ranked candidate domain that accepts mail, or None"""
+    if not candidates:
+        return None
+    try:
+        results = run_async(check_domains_async(candidates, stop_at_first=True, **kwargs))
+    except Exception as e:
+        logger.warning(f"Async DNS check failed: {str(e)}")
+        return None
+    for domain in candidates:
+        if results.get((domain or "").strip().lower().rstrip(".")):
+            return domain
+    return None
+
+def verify_emails_dns_batch(emails, **kwargs):
+    """Check a list of email candidates at once; returns verdicts in the same order"""
+    domains = [email.split('@')[1] if '@' in email else "" for email in emails]
+    try:
+        results = run_async(check_domains_async(domains, **kwargs))
+    except Exception as e:
+        logger.warning(f"Async DNS check failed: {str(e)}")
+        results = {}
+    return [bool(results.get(domain.strip().lower().rstrip("."))) for domain in domains]
+
+def get_dns_cache_stats():
+    """Hit/miss counters of the DNS verdict cache for the debug info"""
+    stats = dict(_dns_cache_stats)
+    total = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+    now = time.time()
+    live = [verdict for verdict, expires_at in _dns_cache.values() if expires_at > now]
+    stats["positive_entries"] = sum(1 for verdict in live if verdict)
+    stats["negative_entries"] = sum(1 for verdict in live if not verdict)
+    return stats
+
+def reset_dns_cache_stats():
+    """Reset the DNS cache counters (the cached verdicts are kept)"""
+    for key in _dns_cache_stats:
+        _dns_cache_stats[key] = 0
+
+def verify_email_exists_dns(email):
+    """Verify if an email might exist by checking MX records"""
+    try:
+        domain = email.split('@')[1]
+        return domain_accepts_mail(domain)
     except Exception as e:
         logger.debug(f"DNS verification error for {email}: {str(e)}")
         return False
 
+def email_passes_mx_check(email):
+    """Format check plus the cached MX verdict of the email's domain"""
+    if not EMAIL_FORMAT_RE.match(email):
+        return False
+    return verify_email_exists_dns(email)
+
+@timed_stage("github")
 def find_email_from_github(name):
     """Try to find a public email from GitHub profiles"""
     try:
         # Search GitHub for the user
         search_url = f"https://api.github.com/search/users?q={name.replace(' ', '+')}"
-        response = requests.get(search_url)
+        response = http_request("GET", search_url)
         
         if response.status_code == 200:
             data = response.json()
@@ -1567,7 +3490,7 @@ def find_email_from_github(name):
                     if username:
                         # Get user details that may include email
                         user_url = f"https://api.github.com/users/{username}"
-                        user_response = requests.get(user_url)
+                        user_response = http_request("GET", user_url)
                         
                         if user_response.status_code == 200:
                             user_data = user_response.json()
@@ -1577,7 +3500,7 @@ def find_email_from_github(name):
                         
                         # If email not in profile, check public contributions
                         events_url = f"https://api.github.com/users/{username}/events/public"
-                        events_response = requests.get(events_url)
+                        events_response = http_request("GET", events_url)
                         
                         if events_response.status_code == 200:
                             events_data = events_response.json()
@@ -1596,39 +3519,44 @@ def find_email_from_github(name):
         logger.warning(f"Error searching GitHub for email: {str(e)}")
         return None
 
+# Text cleaning patterns, compiled once. The LinkedIn terms are the ones the old sequential
+# str.replace loop could still match (longer variants like "• 3rd+" or "view profile" never
+# survived the shorter terms removed before them).
+URL_RE = re.compile(r'https?://\S+')
+LINKEDIN_TERMS_RE = re.compile(
+    "|".join(re.escape(term) for term in
+             ("connection", "premium", "profile", "degree", "view", "3rd", "2nd", "1st"))
+)
+DOMAIN_PATTERN_RE = re.compile(r'([a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9]\.[a-zA-Z]{2,})')
+DOMAIN_NOISE_RE = re.compile(
+    "|".join(re.escape(noise) for noise in sorted([
+        "chieftechnology", "chief", "technology", "officer", "cto", "ceo", "president",
+        "founder", "co-founder", "cofounder", "erthaloka", "director", "manager",
+        "lead", "head", "principal", "senior", "junior", "sr", "jr"
+    ], key=len, reverse=True))
+)
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s.-]')
+WHITESPACE_RE = re.compile(r'\s+')
+NAME_DEGREE_RE = re.compile(r'\s*•\s*\d+(?:st|nd|rd|th).*$')
+NAME_VIEW_PROFILE_RE = re.compile(r'view\s+\w+\s+profile')
+
 def clean_text_data(text, is_domain=False):
     """Clean text data by removing noise and irrelevant information"""
     if not text:
         return text
+    return _clean_text_cached(text, bool(is_domain))
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text_cached(text, is_domain):
+    logger.debug(f"Cleaning text: {text}")
     
-    logger.info(f"Cleaning text: {text}")
-    
-    # Convert to lowercase for better processing
-    text = text.lower()
-    
-    # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-    
-    # Remove LinkedIn specific terminology
-    linkedin_terms = [
-        "view", "profile", "degree", "connection", "3rd", "2nd", "1st", "premium",
-        "• 3rd+", "• 2nd", "• 1st", "'s profile", "view profile"
-    ]
-    
-    for term in linkedin_terms:
-        text = text.replace(term.lower(), "")
-    
-    # Remove suffixes related to job or connection status
-    for suffix in ["'s profile", "view", "connection", "• 3rd+", "• 3rd", "• 2nd", "• 1st"]:
-        if text.endswith(suffix.lower()):
-            text = text[:-len(suffix)]
+    # Lowercase, then drop URLs and LinkedIn terminology in one pass each
+    text = LINKEDIN_TERMS_RE.sub("", URL_RE.sub("", text.lower()))
     
     # If this is a domain, apply more aggressive cleaning
     if is_domain:
-        # Handle domain-specific cleaning
-        
         # Don't return just ".com" or other TLDs
-        if text == ".com" or text == ".org" or text == ".net" or text == ".io":
+        if text in (".com", ".org", ".net", ".io"):
             return "example.com"  # Return a placeholder domain
             
         # If it's just a TLD, return a full placeholder domain
@@ -1636,29 +3564,21 @@ def clean_text_data(text, is_domain=False):
             return "example" + text
         
         # Return proper domain if it matches a domain pattern
-        domain_pattern = re.compile(r'([a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9]\.[a-zA-Z]{2,})')
-        domain_match = domain_pattern.search(text)
+        domain_match = DOMAIN_PATTERN_RE.search(text)
         if domain_match:
             return domain_match.group(1)
             
-        # Remove common domain noise words
-        domain_noise = [
-            "chieftechnology", "chief", "technology", "officer", "cto", "ceo", "president",
-            "founder", "co-founder", "cofounder", "erthaloka", "director", "manager",
-            "lead", "head", "principal", "senior", "junior", "sr", "jr"
-        ]
-        
-        for noise in domain_noise:
-            # Remove repeated noise words
-            while noise in text:
-                text = text.replace(noise, "")
+        # Remove common domain noise words, including ones that removing others put together
+        previous = None
+        while previous != text:
+            previous, text = text, DOMAIN_NOISE_RE.sub("", text)
         
         # Use tldextract if the text looks like a domain
         if "." in text:
             try:
-                ext = tldextract.extract(text)
-                if ext.domain and ext.suffix:
-                    return f"{ext.domain}.{ext.suffix}"
+                domain = registrable_domain(text)
+                if domain:
+                    return domain
             except:
                 pass
         
@@ -1666,12 +3586,8 @@ def clean_text_data(text, is_domain=False):
         if text == "" or len(text) < 3 or "." not in text:
             return "example.com"
     
-    # General cleaning for all text types
-    # Remove special characters
-    text = re.sub(r'[^\w\s.-]', '', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Remove special characters and extra whitespace
+    text = WHITESPACE_RE.sub(" ", SPECIAL_CHARS_RE.sub("", text)).strip()
     
     # If domain, ensure it doesn't have spaces
     if is_domain and " " in text:
@@ -1680,9 +3596,32 @@ def clean_text_data(text, is_domain=False):
             if "." in word and len(word) > 3:
                 return word
     
-    logger.info(f"Cleaned text: {text}")
+    logger.debug(f"Cleaned text: {text}")
     return text
 
+def clean_text_column(values, is_domain=False):
+    """Clean a whole column (pandas Series or list) of text at once; returns a Series
+
+    Plain text is cleaned with vectorized string operations; domains need per-value
+    branching, so each distinct domain goes through the memoized clean_text_data once.
+    """
+    import pandas as pd
+    
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    present = series.notna() & series.astype(str).ne("")
+    if is_domain:
+        cleaned = {value: clean_text_data(value, is_domain=True) for value in series[present].unique()}
+        return series.where(~present, series.map(cleaned))
+    
+    text = series[present].astype(str).str.lower()
+    text = text.str.replace(URL_RE, "", regex=True)
+    text = text.str.replace(LINKEDIN_TERMS_RE, "", regex=True)
+    text = text.str.replace(SPECIAL_CHARS_RE, "", regex=True)
+    text = text.str.replace(WHITESPACE_RE, " ", regex=True).str.strip()
+    result = series.copy()
+    result[present] = text
+    return result
+
 def clean_name(name):
     """Clean a name to extract just the person's name without LinkedIn additions"""
     if not name:
@@ -1692,10 +3631,10 @@ def clean_name(name):
     cleaned_name = clean_text_data(name)
     
     # Remove any degree connection info
-    cleaned_name = re.sub(r'\s*•\s*\d+(?:st|nd|rd|th).*$', '', cleaned_name)
+    cleaned_name = NAME_DEGREE_RE.sub('', cleaned_name)
     
     # Remove "View X's profile" patterns
-    cleaned_name = re.sub(r'view\s+\w+\s+profile', '', cleaned_name)
+    cleaned_name = NAME_VIEW_PROFILE_RE.sub('', cleaned_name)
     
     # Split into parts
     parts = cleaned_name.split()
@@ -1739,15 +3678,206 @@ def get_contact_details(linkedin_url, first_name=None, last_name=None, company_d
     
     return contact_data
 
-async def get_profile_data_from_proxycurl(linkedin_profile_url):
+_api_cache_stats = {"hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+
+def normalize_linkedin_url(url):
+    """Cache key for a LinkedIn URL: the canonical profile URL, or for other pages the
+    lowercase URL without query, fragment or trailing slash"""
+    if not url:
+        return ""
+    profile_url = canonical_profile_url(url)
+    if profile_url:
+        return profile_url
+    url = url.strip().split("?")[0].split("#")[0].rstrip("/").lower()
+    for prefix in ("https://", "http://"):
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+    if url.startswith("www."):
+        url = url[len("www."):]
+    return f"https://www.{url}" if url.startswith("linkedin.com") else url
+
+def api_cache_get(endpoint, key):
+    """Look up a cached API response; returns (found, response), response None for a cached miss"""
+    now = time.time()
+    cache_key = f"{endpoint}:{key}"
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+            row = db.execute(
+                "SELECT response FROM api_cache WHERE cache_key = ? AND expires_at > ?", (cache_key, now)
+            ).fetchone()
+            if row:
+                db.execute("UPDATE api_cache SET last_access = ? WHERE cache_key = ?", (now, cache_key))
+    except Exception as e:
+        logger.debug(f"API cache read failed for {cache_key}: {str(e)}")
+        row = None
+    if not row:
+        _api_cache_stats["misses"] += 1
+        return False, None
+    if row[0] is None:
+        _api_cache_stats["negative_hits"] += 1
+        return True, None
+    _api_cache_stats["hits"] += 1
+    return True, json.loads(row[0])
+
+def api_cache_put(endpoint, key, response):
+    """Store an API response (None caches a miss) and evict the least recently used rows over the cap"""
+    now = time.time()
+    ttl = API_CACHE_TTLS.get(endpoint, API_CACHE_NEGATIVE_TTL) if response is not None else API_CACHE_NEGATIVE_TTL
+    payload = json.dumps(response, default=str) if response is not None else None
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+            db.execute(
+                "INSERT OR REPLACE INTO api_cache (cache_key, endpoint, response, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (f"{endpoint}:{key}", endpoint, payload, now + ttl, now)
+            )
+            overflow = db.execute("SELECT COUNT(*) FROM api_cache").fetchone()[0] - API_CACHE_MAX_ENTRIES
+            if overflow > 0:
+                db.execute(
+                    "DELETE FROM api_cache WHERE cache_key IN "
+                    "(SELECT cache_key FROM api_cache ORDER BY expires_at <= ? DESC, last_access ASC LIMIT ?)",
+                    (now, overflow)
+                )
+                _api_cache_stats["evictions"] += overflow
+    except Exception as e:
+        logger.debug(f"API cache write failed for {endpoint}:{key}: {str(e)}")
+
+def get_api_cache_stats():
+    """Hit/miss counters of the Proxycurl/Apollo response cache"""
+    return dict(_api_cache_stats)
+
+def reset_api_cache_stats():
+    """Reset the API cache counters (the cached responses are kept)"""
+    for key in _api_cache_stats:
+        _api_cache_stats[key] = 0
+
+def get_fresh_leads(profile_urls, max_age_days=None):
+    """Stored leads enriched within the freshness window, as {canonical profile URL: lead}"""
+    max_age_days = LEAD_FRESHNESS_DAYS if max_age_days is None else max_age_days
+    canonical_urls = list({normalize_linkedin_url(url) for url in profile_urls if url})
+    if not canonical_urls or max_age_days <= 0:
+        return {}
+    cutoff = time.time() - max_age_days * 24 * 3600
+    leads = {}
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+            # Stay under SQLite's limit on bound parameters
+            for start in range(0, len(canonical_urls), 500):
+                chunk = canonical_urls[start:start + 500]
+                rows = db.execute(
+                    f"SELECT profile_url, {', '.join(LEAD_FIELDS)}, updated_at FROM leads "
+                    f"WHERE profile_url IN ({', '.join('?' * len(chunk))}) AND updated_at >= ?",
+                    chunk + [cutoff]
+                ).fetchall()
+                for row in rows:
+                    leads[row[0]] = dict(zip(("url",) + LEAD_FIELDS + ("updated_at",), row))
+    except Exception as e:
+        logger.warning(f"Lead store lookup failed: {str(e)}")
+    return leads
+
+def upsert_leads(leads, keyword=None):
+    """Insert or refresh many leads in one transaction; known fields are kept when a refresh lacks them"""
+    now = time.time()
+    rows = [
+        (normalize_linkedin_url(lead["url"]),) + tuple(lead.get(field) or None for field in LEAD_FIELDS) + (keyword, now)
+        for lead in leads if lead.get("url")
+    ]
+    if not rows:
+        return 0
+    updates = ", ".join(f"{field} = COALESCE(excluded.{field}, leads.{field})" for field in LEAD_FIELDS)
+    try:
+        with _cache_db_lock:
+            db = get_cache_db()
+            db.execute("BEGIN")
+            try:
+                db.executemany(
+                    f"INSERT INTO leads (profile_url, {', '.join(LEAD_FIELDS)}, keyword, updated_at) "
+                    f"VALUES ({', '.join('?' * (len(LEAD_FIELDS) + 3))}) "
+                    f"ON CONFLICT (profile_url) DO UPDATE SET {updates}, "
+                    f"keyword = excluded.keyword, updated_at = excluded.updated_at",
+                    rows
+                )
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+        logger.info(f"Stored {len(rows)} leads")
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"Lead store write failed: {str(e)}")
+        return 0
+
+class AsyncRateLimiter:
+    """Spaces out awaiting callers so at most `rate` of them proceed per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0
+        self.next_slot = 0.0
+        self.lock = None
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        # Created lazily so the lock belongs to the loop that uses it
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+# Cache key -> future of an in-flight Proxycurl call, so concurrent callers share one request
+_proxycurl_inflight = {}
+
+async def _proxycurl_request(limiter, call, cache_endpoint=None, cache_key=None, **kwargs):
+    """Make one Proxycurl API call, answering from the response cache and waiting for the rate limiter"""
+    if cache_endpoint:
+        found, response = api_cache_get(cache_endpoint, cache_key)
+        if found:
+            return response
+        inflight_key = f"{cache_endpoint}:{cache_key}"
+        if inflight_key in _proxycurl_inflight:
+            return await asyncio.shield(_proxycurl_inflight[inflight_key])
+        future = asyncio.get_running_loop().create_future()
+        _proxycurl_inflight[inflight_key] = future
+
+    try:
+        if limiter:
+            await limiter.acquire()
+        response = await call(**kwargs)
+    except Exception as e:
+        if cache_endpoint:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    else:
+        if cache_endpoint:
+            # Empty answers are cached as misses so we don't pay for them again right away
+            api_cache_put(cache_endpoint, cache_key, response or None)
+            future.set_result(response)
+        return response
+    finally:
+        if cache_endpoint:
+            _proxycurl_inflight.pop(inflight_key, None)
+
+@timed_stage("proxycurl")
+async def get_profile_data_from_proxycurl(linkedin_profile_url, limiter=None):
     """Get LinkedIn profile data using Proxycurl API"""
+    proxycurl_client = get_proxycurl_client()
     if not proxycurl_client:
         logger.warning("Proxycurl client not available")
         return None
         
     try:
         logger.info(f"Fetching profile data from Proxycurl API: {linkedin_profile_url}")
-        profile_data = await proxycurl_client.linkedin.person.get(
+        profile_data = await _proxycurl_request(
+            limiter, proxycurl_client.linkedin.person.get,
+            cache_endpoint="proxycurl_person", cache_key=normalize_linkedin_url(linkedin_profile_url),
             linkedin_profile_url=linkedin_profile_url
         )
         
@@ -1782,31 +3912,41 @@ async def get_profile_data_from_proxycurl(linkedin_profile_url):
                     
                     # Try to get company domain from company data
                     company_linkedin_url = current_company.get("company_linkedin_url")
-                    if company_linkedin_url and proxycurl_client:
+                    cached_domain = get_cached_company_domain(company_linkedin_url, company_name)
+                    if cached_domain:
+                        extracted_data["company_domain"] = cached_domain
+                    elif company_linkedin_url and proxycurl_client:
                         try:
-                            company_data = await proxycurl_client.linkedin.company.get(
+                            company_data = await _proxycurl_request(
+                                limiter, proxycurl_client.linkedin.company.get,
+                                cache_endpoint="proxycurl_company",
+                                cache_key=normalize_linkedin_url(company_linkedin_url),
                                 url=company_linkedin_url
                             )
                             if company_data and company_data.get("website"):
                                 website = company_data.get("website")
-                                ext = tldextract.extract(website)
-                                domain = f"{ext.domain}.{ext.suffix}"
-                                extracted_data["company_domain"] = domain
+                                domain = registrable_domain(website)
+                                if domain:
+                                    extracted_data["company_domain"] = domain
+                                    cache_company_domain(domain, company_linkedin_url, company_name)
                         except Exception as e:
                             logger.warning(f"Error getting company data from Proxycurl: {str(e)}")
         
         # Try to get email using Proxycurl's email finder if domain is available
         if extracted_data["company_domain"] and proxycurl_client:
             try:
-                email_data = await proxycurl_client.linkedin.person.lookup_email(
-                    first_name=extracted_data["first_name"],
-                    last_name=extracted_data["last_name"],
-                    company_domain=extracted_data["company_domain"]
+                email_data = await _proxycurl_request(
+                    limiter, proxycurl_client.linkedin.person.lookup_email,
+                    cache_endpoint="proxycurl_email",
+                    cache_key=f"{normalize_linkedin_url(linkedin_profile_url)}|{extracted_data['company_domain']}",
+                    linkedin_profile_url=linkedin_profile_url
                 )
                 
                 if email_data and email_data.get("email"):
                     extracted_data["email"] = email_data.get("email")
                     extracted_data["email_source"] = "proxycurl"
+                    record_email_format(extracted_data["email"], extracted_data["first_name"],
+                                        extracted_data["last_name"])
             except Exception as e:
                 logger.warning(f"Error looking up email from Proxycurl: {str(e)}")
                 
@@ -1816,17 +3956,54 @@ async def get_profile_data_from_proxycurl(linkedin_profile_url):
         logger.error(f"Error fetching profile from Proxycurl: {str(e)}")
         return None
 
+async def _enrich_profiles_async(profile_urls, concurrency, rate_limit):
+    """Run the Proxycurl person/company/email lookups for many profiles concurrently"""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AsyncRateLimiter(rate_limit)
+
+    async def enrich(profile_url):
+        async with semaphore:
+            try:
+                return profile_url, await get_profile_data_from_proxycurl(profile_url, limiter=limiter)
+            except Exception as e:
+                logger.warning(f"Proxycurl enrichment failed for {profile_url}: {str(e)}")
+                return profile_url, None
+
+    results = await asyncio.gather(*(enrich(url) for url in profile_urls))
+    return dict(results)
+
+def enrich_profiles_proxycurl(profiles, concurrency=None, rate_limit=None):
+    """Enrich a whole search result set through Proxycurl in one batch
+
+    Returns {profile_url: proxycurl_data or None}. At most `concurrency` profiles are in
+    flight and all API calls together stay under `rate_limit` requests per second.
+    """
+    if not get_proxycurl_client():
+        logger.warning("Proxycurl client not available")
+        return {}
+    profile_urls = []
+    for profile in profiles:
+        url = profile.url if isinstance(profile, Profile) else profile
+        if url and url not in profile_urls:
+            profile_urls.append(url)
+    if not profile_urls:
+        return {}
+
+    concurrency = concurrency or PROXYCURL_CONCURRENCY
+    rate_limit = rate_limit if rate_limit is not None else PROXYCURL_RATE_LIMIT
+    logger.info(f"Enriching {len(profile_urls)} profiles via Proxycurl "
+                f"(concurrency {concurrency}, {rate_limit} requests/s)")
+    with stage_timer("proxycurl_batch"):
+        return run_async(_enrich_profiles_async(profile_urls, concurrency, rate_limit))
+
 def get_company_domain_hybrid(driver, profile_url):
     """Get company domain using both Selenium and Proxycurl if available"""
     # First try with Proxycurl if available
     domain = None
-    if proxycurl_client:
+    if get_proxycurl_client():
         try:
-            # Run the async function in a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            profile_data = loop.run_until_complete(get_profile_data_from_proxycurl(profile_url))
-            loop.close()
+            # Run the async function on the shared event loop
+            profile_data = run_async(get_profile_data_from_proxycurl(profile_url))
             
             if profile_data and profile_data.get("company_domain"):
                 domain = profile_data.get("company_domain")
@@ -1845,19 +4022,24 @@ def get_company_domain_hybrid(driver, profile_url):
         logger.error(f"Error in get_company_domain_hybrid: {str(e)}")
         return None
 
-def get_profile_data_hybrid(driver, profile_url, use_selenium=True, use_proxycurl=True):
-    """Get profile data using either Selenium, Proxycurl, or both"""
+def get_profile_data_hybrid(driver, profile_url, use_selenium=True, use_proxycurl=True, search_data=None,
+                            proxycurl_data=None, resolve_email=True):
+    """Get profile data using either Selenium, Proxycurl, or both
+
+    search_data is the Profile from search_profiles; when its card data is enough to
+    resolve the company domain, the profile page is not opened. proxycurl_data is a result
+    prefetched by enrich_profiles_proxycurl, used instead of a per-profile API call.
+    With resolve_email=False the free email lookup is left to resolve_profile_email.
+    """
     profile_data = {"name": None, "url": profile_url, "first_name": None, "last_name": None, 
                     "company_domain": None, "email": None, "email_source": None}
     
     # Try Proxycurl first if available and enabled
-    if proxycurl_client and use_proxycurl:
+    if proxycurl_data or (use_proxycurl and get_proxycurl_client()):
         try:
-            # Run the async function in a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            proxycurl_data = loop.run_until_complete(get_profile_data_from_proxycurl(profile_url))
-            loop.close()
+            if not proxycurl_data:
+                # Run the async function on the shared event loop
+                proxycurl_data = run_async(get_profile_data_from_proxycurl(profile_url))
             
             if proxycurl_data:
                 logger.info(f"Successfully got data from Proxycurl for {profile_url}")
@@ -1902,6 +4084,16 @@ def get_profile_data_hybrid(driver, profile_url, use_selenium=True, use_proxycur
             except Exception as e:
                 logger.warning(f"Error cleaning name: {str(e)}")
         
+        # Try the company shown in the search card before opening the profile page
+        if not profile_data["company_domain"] and search_data:
+            try:
+                company_domain = resolve_domain_from_search_data(driver, search_data)
+                if company_domain:
+                    logger.info(f"Resolved company domain from search card: {company_domain}")
+                    profile_data["company_domain"] = company_domain
+            except Exception as e:
+                logger.warning(f"Error resolving domain from search card: {str(e)}")
+        
         # If company domain is missing, try to extract it
         if not profile_data["company_domain"]:
             try:
@@ -1915,11 +4107,17 @@ def get_profile_data_hybrid(driver, profile_url, use_selenium=True, use_proxycur
         if profile_data["company_domain"]:
             profile_data["company_domain"] = clean_text_data(profile_data["company_domain"], is_domain=True)
     
-    # Generate email if missing but we have the necessary data
+    if resolve_email:
+        resolve_profile_email(profile_data)
+    
+    return profile_data
+
+def resolve_profile_email(profile_data):
+    """Generate an email for profile data from get_profile_data_hybrid if it has none yet"""
     if not profile_data["email"] and profile_data["first_name"] and profile_data["company_domain"]:
         try:
             email_result = fetch_email_free(
-                profile_url,
+                profile_data["url"],
                 profile_data["first_name"],
                 profile_data["last_name"],
                 profile_data["company_domain"]
@@ -1931,4 +4129,137 @@ def get_profile_data_hybrid(driver, profile_url, use_selenium=True, use_proxycur
         except Exception as e:
             logger.warning(f"Error generating email: {str(e)}")
     
-    return profile_data
\ No newline at end of file
+    return profile_data
+
+class StagePipeline:
+    """Worker-thread stages connected by bounded queues
+
+    The caller runs the first (browser) stage itself and feeds items in with put(), which
+    blocks while the next stage's queue is full. Finished items are collected with drain()
+    and close(); call close() in a finally so a failed run still finishes what it queued and
+    its workers exit. A stage that raises logs a warning and passes the item on unchanged.
+    """
+
+    _DONE = object()
+
+    def __init__(self, stages, queue_size=None):
+        # stages: list of (name, func, workers); func takes an item and returns the item to pass on
+        queue_size = queue_size or PIPELINE_QUEUE_SIZE
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self.output = queue.Queue()
+        self.stage_names = [name for name, _, _ in stages]
+        self.worker_counts = [workers for _, _, workers in stages]
+        self.threads = []
+        self.closed = False
+        for index, (name, func, workers) in enumerate(stages):
+            self._counter(name)
+            outbox = self.queues[index + 1] if index + 1 < len(stages) else self.output
+            # Sentinels the last worker of this stage sends on so the next stage shuts down too
+            next_workers = self.worker_counts[index + 1] if index + 1 < len(stages) else 1
+            remaining = {"workers": workers}
+            for number in range(workers):
+                thread = threading.Thread(target=self._work, name=f"{name}-{number}", daemon=True,
+                                          args=(name, func, self.queues[index], outbox, remaining, next_workers))
+                thread.start()
+                self.threads.append(thread)
+
+    def _counter(self, name):
+        return self.counters.setdefault(name, {"processed": 0, "errors": 0, "busy_s": 0.0, "blocked_s": 0.0})
+
+    def _record(self, name, seconds, error=False):
+        with self.lock:
+            counter = self._counter(name)
+            counter["processed"] += 1
+            counter["busy_s"] += seconds
+            if error:
+                counter["errors"] += 1
+
+    def _blocked(self, name, seconds):
+        with self.lock:
+            self._counter(name)["blocked_s"] += seconds
+
+    def _work(self, name, func, inbox, outbox, remaining, next_workers):
+        while True:
+            item = inbox.get()
+            if item is self._DONE:
+                with self.lock:
+                    remaining["workers"] -= 1
+                    last = remaining["workers"] == 0
+                if last:
+                    for _ in range(next_workers):
+                        outbox.put(self._DONE)
+                return
+            started = time.perf_counter()
+            try:
+                item = func(item)
+                self._record(name, time.perf_counter() - started)
+            except Exception as e:
+                self._record(name, time.perf_counter() - started, error=True)
+                logger.warning(f"Pipeline stage {name} failed: {str(e)}")
+            started = time.perf_counter()
+            outbox.put(item)
+            self._blocked(name, time.perf_counter() - started)
+
+    @contextmanager
+    def measure(self, name):
+        """Count a block of code run by the caller (the browser stage) in the stage counters"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(name, time.perf_counter() - started, error=failed)
+
+    def put(self, item, source="browser"):
+        """Hand an item to the first worker stage, waiting while its queue is full"""
+        started = time.perf_counter()
+        self.queues[0].put(item)
+        self._blocked(source, time.perf_counter() - started)
+
+    def drain(self):
+        """Items that made it through every stage so far, without waiting"""
+        items = []
+        while True:
+            try:
+                item = self.output.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not self._DONE:
+                items.append(item)
+
+    def close(self):
+        """Stop accepting items, yield the rest as they finish and join the worker threads
+
+        Safe to call from a finally block after the caller's loop failed; a second call yields nothing.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        for _ in range(self.worker_counts[0]):
+            self.queues[0].put(self._DONE)
+        while True:
+            item = self.output.get()
+            if item is self._DONE:
+                break
+            yield item
+        for thread in self.threads:
+            thread.join()
+
+    def stats(self):
+        """Per-stage processed/error counts, busy and blocked seconds, throughput and queue depth"""
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        with self.lock:
+            counters = {name: dict(counter) for name, counter in self.counters.items()}
+        depths = {name: q.qsize() for name, q in zip(self.stage_names, self.queues)}
+        for name, counter in counters.items():
+            counter["busy_s"] = round(counter["busy_s"], 3)
+            counter["blocked_s"] = round(counter["blocked_s"], 3)
+            counter["items_per_min"] = round(counter["processed"] / elapsed * 60, 1)
+            counter["queue_depth"] = depths.get(name, 0)
+        return counters
\ No newline at end of file
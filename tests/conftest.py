@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# Keep the on-disk caches out of the working tree and make the top-level modules importable
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="scraper-tests-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
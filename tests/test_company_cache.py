@@ -0,0 +1,55 @@
+import scraper
+
+def _resolve(monkeypatch, profile, resolved=None):
+    monkeypatch.setattr(scraper, "first_resolving_domain", lambda candidates, **kwargs: resolved)
+    scraper.reset_company_cache_stats()
+    return scraper.resolve_domain_from_search_data(None, profile)
+
+def test_fallback_to_profile_page_counts_one_miss(monkeypatch):
+    profile = scraper.Profile("https://www.linkedin.com/in/a", "A", company_name="Quuxly Widgets Dynamics",
+                              company_source="link")
+    assert _resolve(monkeypatch, profile) is None
+    assert scraper.get_company_cache_stats()["misses"] == 0
+
+    # The profile page lookup that follows is the one that counts
+    scraper.get_cached_company_domain(None, profile.company_name)
+    assert scraper.get_company_cache_stats()["misses"] == 1
+
+def test_resolved_from_card_counts_one_miss(monkeypatch):
+    scraper.add_company_domain("Frobnicate Labs", "frobnicate.io")
+    profile = scraper.Profile("https://www.linkedin.com/in/b", "B", company_name="Frobnicate Labs",
+                              company_source="link")
+    assert _resolve(monkeypatch, profile) == "frobnicate.io"
+    assert scraper.get_company_cache_stats() == {"hits": 0, "misses": 1}
+
+def test_headline_company_falls_back_to_profile_page(monkeypatch):
+    # "Engineer - AI" splits into "AI"; a resolving ai.com must not skip the experience section
+    profile = scraper.Profile("https://www.linkedin.com/in/c", "C", headline="Engineer - AI", company_name="AI",
+                              company_source="headline")
+    assert _resolve(monkeypatch, profile, resolved="ai.com") is None
+
+def test_summary_company_is_guessed_from_card(monkeypatch):
+    profile = scraper.Profile("https://www.linkedin.com/in/d", "D", company_name="Zentrix Quantum Works",
+                              company_source="summary")
+    assert _resolve(monkeypatch, profile, resolved="zentrixquantum.com") == "zentrixquantum.com"
+
+def test_unverified_fuzzy_match_is_not_the_fallback_domain(monkeypatch):
+    scraper.add_company_domain("Glorbix Analytics", "glorbix.ai")
+    monkeypatch.setattr(scraper, "first_resolving_domain", lambda candidates, **kwargs: None)
+    assert scraper.lookup_company_domain("Glorbix Analytic") == ("glorbix.ai", "fuzzy")
+
+    record = {"company_name": "Glorbix Analytic", "domains": []}
+    assert scraper.domain_from_company_record(record) == "glorbixanalytic.com"
+
+def test_verified_fuzzy_match_is_used(monkeypatch):
+    scraper.add_company_domain("Plentara Systems", "plentara.dev")
+    monkeypatch.setattr(scraper, "first_resolving_domain", lambda candidates, **kwargs: candidates[0])
+    record = {"company_name": "Plentara System", "domains": []}
+    assert scraper.domain_from_company_record(record) == "plentara.dev"
+
+def test_card_lookup_counts_the_index_once(monkeypatch):
+    profile = scraper.Profile("https://www.linkedin.com/in/e", "E", company_name="Vexmoor Tidal Holdings",
+                              company_source="link")
+    scraper.reset_company_index_stats()
+    _resolve(monkeypatch, profile)
+    assert sum(scraper.get_company_index_stats().values()) == 1
@@ -0,0 +1,121 @@
+import socket
+import threading
+import time
+import uuid
+
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+import pytest
+
+import scraper
+
+class StubDNSServer:
+    """In-process UDP nameserver: answers MX/A for the zones it knows, NXDOMAIN otherwise
+
+    Each query is answered on its own thread after the zone's delay, and the server counts
+    queries and the most it ever had in flight at once.
+    """
+
+    def __init__(self):
+        self.zones = {}  # name -> (record type, delay in seconds)
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(4096)
+            except OSError:
+                return
+            threading.Thread(target=self._answer, args=(data, addr), daemon=True).start()
+
+    def _answer(self, data, addr):
+        query = dns.message.from_wire(data)
+        name = str(query.question[0].name).rstrip(".")
+        rdtype = dns.rdatatype.to_text(query.question[0].rdtype)
+        with self.lock:
+            self.queries.append((name, rdtype))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        record_type, delay = self.zones.get(name, (None, 0))
+        time.sleep(delay)
+        response = dns.message.make_response(query)
+        if record_type is None:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif record_type == rdtype:
+            rdata = f"10 mx.{name}." if rdtype == "MX" else "192.0.2.1"
+            response.answer.append(dns.rrset.from_text(f"{name}.", 600, "IN", rdtype, rdata))
+        with self.lock:
+            self.in_flight -= 1
+        try:
+            self.sock.sendto(response.to_wire(), addr)
+        except OSError:
+            pass
+
+    def close(self):
+        self.sock.close()
+
+@pytest.fixture
+def stub_dns():
+    server = StubDNSServer()
+    yield server
+    server.close()
+
+def _names(*labels):
+    # Fresh names per test: verdicts are cached in memory and in the on-disk cache
+    run = uuid.uuid4().hex[:8]
+    return [f"{label}-{run}.test" for label in labels]
+
+def _check(server, domains, **kwargs):
+    return scraper.run_async(scraper.check_domains_async(
+        domains, nameservers=["127.0.0.1"], port=server.port, timeout=2, **kwargs))
+
+def test_checks_run_concurrently_up_to_the_limit(stub_dns):
+    domains = _names("a", "b", "c", "d", "e", "f")
+    for domain in domains:
+        stub_dns.zones[domain] = ("MX", 0.3)
+
+    started = time.time()
+    results = _check(stub_dns, domains, max_in_flight=3)
+    elapsed = time.time() - started
+
+    assert results == {domain: True for domain in domains}
+    assert stub_dns.max_in_flight == 3
+    # Six 0.3 s lookups three at a time, not one after another
+    assert elapsed < 1.2
+
+def test_a_record_fallback_and_nxdomain(stub_dns):
+    mx_domain, a_domain, missing = _names("mx", "a-only", "missing")
+    stub_dns.zones[mx_domain] = ("MX", 0)
+    stub_dns.zones[a_domain] = ("A", 0)
+    assert _check(stub_dns, [mx_domain, a_domain, missing]) == {mx_domain: True, a_domain: True, missing: False}
+
+def test_first_resolving_domain_keeps_ranking_order(stub_dns):
+    missing, slow, fast = _names("missing", "slow", "fast")
+    stub_dns.zones[slow] = ("MX", 0.4)
+    stub_dns.zones[fast] = ("MX", 0)
+    # The fast answer arrives first, but the higher-ranked slow domain wins
+    winner = scraper.first_resolving_domain([missing, slow, fast], nameservers=["127.0.0.1"],
+                                            port=stub_dns.port, timeout=2)
+    assert winner == slow
+
+def test_second_check_is_served_from_the_cache(stub_dns):
+    good, missing = _names("good", "missing")
+    stub_dns.zones[good] = ("MX", 0)
+    assert _check(stub_dns, [good, missing]) == {good: True, missing: False}
+    queries = len(stub_dns.queries)
+
+    scraper.reset_dns_cache_stats()
+    assert _check(stub_dns, [good, missing]) == {good: True, missing: False}
+    assert len(stub_dns.queries) == queries
+    stats = scraper.get_dns_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 0
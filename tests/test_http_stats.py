@@ -0,0 +1,57 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import scraper
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 503 to the first request and 200 afterwards"""
+    requests_seen = 0
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        self.send_response(503 if self.requests_seen == 1 else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def flaky_server(monkeypatch):
+    FlakyHandler.requests_seen = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Retry immediately instead of backing off
+    monkeypatch.setattr(scraper, "wait_exponential_jitter", lambda **kwargs: lambda retry_state: 0)
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+def test_retry_after_stats_reset_does_not_fail(flaky_server, monkeypatch):
+    record_http = scraper._record_http
+
+    def record_then_reset(*args, **kwargs):
+        record_http(*args, **kwargs)
+        scraper.reset_http_stats()
+
+    monkeypatch.setattr(scraper, "_record_http", record_then_reset)
+    response = scraper.http_request("GET", flaky_server, max_attempts=2)
+    assert response.status_code == 200
+    assert FlakyHandler.requests_seen == 2
+
+def test_concurrent_requests_are_all_counted(flaky_server):
+    host = flaky_server.split("/")[2]
+    scraper.reset_http_stats()
+    threads = [threading.Thread(target=scraper.http_request, args=("GET", flaky_server), kwargs={"max_attempts": 2})
+               for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = scraper.get_http_stats()[host]
+    assert stats["requests"] == 21
+    assert stats["retries"] == 1
+    assert stats["statuses"] == {"503": 1, "200": 20}
@@ -0,0 +1,35 @@
+import time
+
+import scraper
+
+class FakeDriver:
+    """Answers readiness checks from a fixed set of selectors present on the page"""
+
+    def __init__(self, present):
+        self.present = present
+
+    def execute_script(self, script, selector):
+        return any(part.strip() in self.present for part in selector.split(","))
+
+def test_profile_without_experience_is_ready_after_optional_wait(monkeypatch):
+    monkeypatch.setattr(scraper, "OPTIONAL_SECTION_TIMEOUT", 0.3)
+    started = time.time()
+    assert scraper.wait_for_page(FakeDriver({"section.pv-top-card"}), "profile", timeout=5)
+    assert time.time() - started < 2
+
+def test_profile_waits_for_top_card_not_experience():
+    assert not scraper.wait_for_page(FakeDriver({"#experience"}), "profile", timeout=0.5)
+
+def test_search_results_need_a_result_card():
+    assert not scraper.wait_for_page(FakeDriver({"a[href*='/in/']"}), "search_results", timeout=0.5)
+    assert scraper.wait_for_page(FakeDriver({"li.reusable-search__result-container"}), "search_results", timeout=1)
+
+# What LinkedIn's page shell and footer contain before any page content renders
+SHELL_ONLY = {"main", "a[href*='http']:not([href*='linkedin.com'])", "a[href*='/in/']"}
+
+def test_shell_only_page_is_not_ready():
+    for condition in ("profile", "company", "search_results"):
+        assert not scraper.wait_for_page(FakeDriver(SHELL_ONLY), condition, timeout=0.5), condition
+
+def test_company_ready_on_about_module():
+    assert scraper.wait_for_page(FakeDriver({"section.org-about-module"}), "company", timeout=1)
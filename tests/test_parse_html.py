@@ -0,0 +1,59 @@
+import pytest
+
+import scraper
+
+pytestmark = pytest.mark.skipif(not scraper.LXML_AVAILABLE, reason="lxml not installed")
+
+# A current experience entry as LinkedIn renders it: every visible label is followed by a
+# .visually-hidden copy for screen readers, which Selenium's .text leaves out
+PROFILE_HTML = """
+<html><body>
+  <div class="ph5"><div class="mt2"><div>Senior Engineer <span class="visually-hidden">Senior Engineer</span></div></div></div>
+  <section id="experience"><ul>
+    <li>
+      <a href="/company/google/">
+        <span aria-hidden="true">Google</span><span class="visually-hidden">Google</span>
+      </a>
+      <span class="t-14"><span aria-hidden="true">Full-time</span><span class="visually-hidden">Full-time</span></span>
+    </li>
+  </ul></section>
+</body></html>
+"""
+
+COMPANY_HTML = """
+<html><body>
+  <a data-control-name="website" href="https://about.google/">
+    <span>about.google</span><span class="visually-hidden">about.google</span>
+  </a>
+</body></html>
+"""
+
+def test_profile_text_skips_visually_hidden_copies():
+    record = scraper.parse_profile_html(PROFILE_HTML)
+    assert record["company_name"] == "Google"
+    assert record["company_url"] == "https://www.linkedin.com/company/google/"
+    assert record["headline"] == "Senior Engineer"
+
+def test_element_text_keeps_tail_after_hidden_span():
+    import lxml.html
+
+    element = lxml.html.fromstring('<p>Acme <span class="visually-hidden">Acme</span>Robotics<!-- x --> Inc</p>')
+    assert scraper._element_text(element) == "Acme Robotics Inc"
+
+def test_company_page_website():
+    record = scraper.parse_company_html(COMPANY_HTML)
+    assert record["website"] == "https://about.google/"
+    assert record["domains"][0] == "about.google"
+
+def test_unrelated_company_link_is_not_tied_to_headline_name():
+    html = """
+    <html><body>
+      <div class="ph5"><div class="mt2"><div>Engineer at Initech</div></div></div>
+      <aside><a href="/company/some-other-co/">Some Other Co</a></aside>
+    </body></html>
+    """
+    record = scraper.parse_profile_html(html)
+    assert record["company_name"] == "Initech"
+    assert record["company_url"] == "https://www.linkedin.com/company/some-other-co/"
+    assert record["name_from_link"] is False
+    assert scraper.parse_profile_html(PROFILE_HTML)["name_from_link"] is True
@@ -0,0 +1,36 @@
+import pytest
+
+import scraper
+
+def _pipeline():
+    return scraper.StagePipeline([
+        ("double", lambda item: item * 2, 2),
+        ("increment", lambda item: item + 1, 3)
+    ], queue_size=2)
+
+def test_close_in_finally_finishes_queued_items_after_a_failure():
+    pipeline = _pipeline()
+    finished = []
+
+    def profile_stream():
+        yield from range(5)
+        raise RuntimeError("LinkedIn security checkpoint detected during search")
+
+    # The shape of the extraction loop in app.run_extraction
+    with pytest.raises(RuntimeError):
+        try:
+            for item in profile_stream():
+                pipeline.put(item)
+                finished.extend(pipeline.drain())
+        finally:
+            finished.extend(pipeline.close())
+
+    assert sorted(finished) == [1, 3, 5, 7, 9]
+    assert not any(thread.is_alive() for thread in pipeline.threads)
+    assert pipeline.stats()["increment"]["processed"] == 5
+
+def test_close_twice_yields_nothing():
+    pipeline = _pipeline()
+    pipeline.put(1)
+    assert list(pipeline.close()) == [3]
+    assert list(pipeline.close()) == []
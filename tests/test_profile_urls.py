@@ -0,0 +1,45 @@
+import pytest
+
+import scraper
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/jane-doe",
+    "https://www.linkedin.com/in/jane-doe/",
+    "https://www.linkedin.com/in/Jane-Doe/",
+    "https://www.linkedin.com/in/jane-doe?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAA&trk=x",
+    "https://www.linkedin.com/in/jane-doe/#experience",
+    "https://www.linkedin.com/in/jane-doe/details/experience/",
+    "https://de.linkedin.com/in/jane-doe",
+    "https://m.linkedin.com/in/jane-doe/",
+    "http://linkedin.com/in/jane-doe",
+    "www.linkedin.com/in/jane-doe",
+    "  https://www.linkedin.com/in/jane-doe  ",
+])
+def test_profile_url_variants_share_one_key(url):
+    assert scraper.canonical_profile_url(url) == "https://www.linkedin.com/in/jane-doe"
+
+def test_percent_encoded_slug_is_decoded():
+    url = "https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller-42/"
+    assert scraper.canonical_profile_url(url) == "https://www.linkedin.com/in/jürgen-müller-42"
+
+def test_member_id_keeps_its_case():
+    assert scraper.canonical_profile_url("https://www.linkedin.com/in/ACoAAB1x2Y/") == \
+        "https://www.linkedin.com/in/ACoAAB1x2Y"
+
+def test_mini_profile_urn_link():
+    url = "https://www.linkedin.com/search/results/people/?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAB1x2Y"
+    assert scraper.canonical_profile_url(url) == "https://www.linkedin.com/in/ACoAAB1x2Y"
+
+@pytest.mark.parametrize("url", [
+    None,
+    "",
+    "https://www.linkedin.com/company/in/foo",
+    "https://www.linkedin.com/company/acme/",
+    "https://www.linkedin.com/school/in/",
+    "https://www.linkedin.com/in/",
+    "https://www.linkedin.com/feed/",
+    "https://example.com/in/jane-doe",
+    "https://linkedin.com.evil.io/in/jane-doe",
+])
+def test_non_profile_urls(url):
+    assert scraper.canonical_profile_url(url) is None
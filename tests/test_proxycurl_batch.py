@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import scraper
+
+pytestmark = pytest.mark.skipif(not scraper.PROXYCURL_AVAILABLE, reason="proxycurl-py[asyncio] not installed")
+
+class MockProxycurl(BaseHTTPRequestHandler):
+    """Person, company and email endpoints; slugs starting with "broken" get a 404"""
+
+    calls = Counter()
+    company = None
+    company_name = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        self.calls[(path, query.get("linkedin_profile_url") or query.get("url"))] += 1
+        time.sleep(0.2)
+        if path.endswith("/profile/email"):
+            body = {"email": "jane@acme-mock.com"}
+        elif path.endswith("/linkedin/company"):
+            body = {"website": "https://www.acme-mock.com/"}
+        elif path.endswith("/linkedin") and "linkedin_profile_url" in query:
+            slug = query["linkedin_profile_url"].rstrip("/").rsplit("/", 1)[-1]
+            if slug.startswith("broken"):
+                self.send_response(404)
+                self.end_headers()
+                self.wfile.write(b'{"code": 404, "description": "Person not found"}')
+                return
+            body = {"first_name": "Jane", "last_name": slug, "headline": "Engineer",
+                    "experiences": [{"company": self.company_name, "company_linkedin_url": self.company, "ends_at": None}]}
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(data)
+
+@pytest.fixture
+def mock_proxycurl(monkeypatch):
+    MockProxycurl.calls = Counter()
+    # A company no earlier test has cached, by URL or by name
+    run = uuid.uuid4().hex[:8]
+    MockProxycurl.company = f"https://www.linkedin.com/company/acme-mock-{run}"
+    MockProxycurl.company_name = f"Acme Mock {run}"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockProxycurl)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("PROXYCURL_API_KEY", "test-key")
+    monkeypatch.setattr(scraper, "PROXYCURL_API_KEY", "test-key")
+    monkeypatch.setattr(scraper, "PROXYCURL_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    scraper.get_proxycurl_client.cache_clear()
+    yield MockProxycurl
+    scraper.get_proxycurl_client.cache_clear()
+    server.shutdown()
+    server.server_close()
+
+def _slugs(*labels):
+    run = uuid.uuid4().hex[:8]
+    return [f"{label}-{run}" for label in labels]
+
+def test_batch_enrichment(mock_proxycurl):
+    urls = [f"https://www.linkedin.com/in/{slug}" for slug in _slugs("ann", "bob", "cy")]
+    started = time.time()
+    results = scraper.enrich_profiles_proxycurl(urls, concurrency=3, rate_limit=100)
+    elapsed = time.time() - started
+
+    assert set(results) == set(urls)
+    for url in urls:
+        assert results[url]["company_domain"] == "acme-mock.com"
+        assert results[url]["email"] == "jane@acme-mock.com"
+        assert results[url]["email_source"] == "proxycurl"
+    # Three profiles at once: person, company and email rounds, not nine sequential calls
+    assert elapsed < 1.5
+
+def test_duplicate_urls_are_fetched_once(mock_proxycurl):
+    slug, = _slugs("dup")
+    variants = [f"https://www.linkedin.com/in/{slug}", f"https://www.linkedin.com/in/{slug}/",
+                f"https://de.linkedin.com/in/{slug}?trk=x"]
+    results = scraper.enrich_profiles_proxycurl(variants, concurrency=3, rate_limit=100)
+
+    assert all(results[url] and results[url]["last_name"] == slug for url in variants)
+    person_calls = sum(count for (path, _), count in mock_proxycurl.calls.items() if path.endswith("/linkedin"))
+    assert person_calls == 1
+    # Every profile works at the same company: one company lookup shared while in flight
+    company_calls = sum(count for (path, _), count in mock_proxycurl.calls.items()
+                        if path.endswith("/linkedin/company"))
+    assert company_calls == 1
+
+def test_one_failing_request_does_not_sink_the_batch(mock_proxycurl):
+    good, broken = [f"https://www.linkedin.com/in/{slug}" for slug in _slugs("good", "broken")]
+    results = scraper.enrich_profiles_proxycurl([good, broken], concurrency=2, rate_limit=100)
+
+    assert results[broken] is None
+    assert results[good]["company_domain"] == "acme-mock.com"
+    # The failure is not cached: a retry asks the API again
+    scraper.enrich_profiles_proxycurl([broken], concurrency=1, rate_limit=100)
+    assert sum(count for (path, url), count in mock_proxycurl.calls.items() if url == broken) == 2
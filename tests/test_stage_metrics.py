@@ -0,0 +1,62 @@
+import time
+
+import scraper
+
+def test_generator_stage_excludes_consumer_time():
+    @scraper.timed_stage("test_generator")
+    def produce():
+        for value in range(3):
+            time.sleep(0.05)
+            yield value
+
+    scraper.reset_stage_metrics()
+    for _ in produce():
+        time.sleep(0.2)
+    metrics = scraper.get_stage_metrics()["test_generator"]
+    assert metrics["count"] == 1
+    assert 0.15 <= metrics["total_s"] < 0.4
+
+def test_generator_stage_recorded_when_consumer_stops_early():
+    @scraper.timed_stage("test_generator_early")
+    def produce():
+        while True:
+            yield 1
+
+    scraper.reset_stage_metrics()
+    for _ in produce():
+        break
+    assert scraper.get_stage_metrics()["test_generator_early"]["count"] == 1
+
+class FakeSearchDriver:
+    current_url = "https://www.linkedin.com/search/results/people/?keywords=x"
+
+    def execute_script(self, script, *args):
+        return 0
+
+def test_slow_on_batch_is_not_counted_as_search(monkeypatch):
+    def fake_extract(driver, profiles, processed_urls, limit, mode=None):
+        start = len(profiles)
+        for number in range(start, min(start + 10, limit)):
+            profiles.add(scraper.Profile(f"https://www.linkedin.com/in/p{number}", f"P {number}"))
+
+    monkeypatch.setattr(scraper, "navigate", lambda *args, **kwargs: True)
+    monkeypatch.setattr(scraper, "capture_screenshot", lambda *args, **kwargs: None)
+    monkeypatch.setattr(scraper, "wait_for_scroll_settle", lambda driver, height: height)
+    monkeypatch.setattr(scraper, "extract_profiles_from_page", fake_extract)
+    monkeypatch.setattr(scraper.random, "uniform", lambda low, high: 0)
+
+    batches = []
+
+    def slow_on_batch(new_profiles):
+        # Stands in for the app's lead-store lookup and Proxycurl batch
+        time.sleep(0.3)
+        batches.append(len(new_profiles))
+
+    scraper.reset_stage_metrics()
+    found = list(scraper.iter_search_profiles(FakeSearchDriver(), "x", limit=20, on_batch=slow_on_batch,
+                                              pagination="direct"))
+    assert len(found) == 20
+    assert batches == [10, 10]
+    search = scraper.get_stage_metrics()["search"]
+    assert search["count"] == 1
+    assert search["total_s"] < 0.2